@@ -1,10 +1,24 @@
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 import os
-from extratores.gastos_vereadores import extrair_gastos_vereadores
-from extratores.comissoes_votacoes import extrair_comissoes_votacoes
-from extratores.projetos_tramitacao import extrair_projetos_tramitacao
+from extratores.registro import descobrir_extratores
+from extratores.log import obter_logger
+from extratores.metricas import contar, iniciar_servidor
+
+log = obter_logger("app")
+
+# Endpoint /metrics (formato Prometheus), habilitado com MONITORAMENTO_PORTA_METRICAS
+if os.environ.get("MONITORAMENTO_PORTA_METRICAS"):
+    try:
+        iniciar_servidor(
+            os.environ["MONITORAMENTO_PORTA_METRICAS"],
+            os.environ.get("MONITORAMENTO_ENDERECO_METRICAS", "127.0.0.1")
+        )
+    except (OSError, ValueError) as e:
+        log.warning(
+            "Não foi possível iniciar o endpoint de métricas",
+            extra={"porta": os.environ["MONITORAMENTO_PORTA_METRICAS"], "erro": str(e)}
+        )
 
 # Configuração da página
 st.set_page_config(
@@ -20,203 +34,114 @@ st.markdown("---")
 # Sidebar para seleção
 st.sidebar.header(" Configurações")
 
-# Seleção do tipo de extração
+# Extratores disponíveis (cada módulo de extratores/ com EXTRATOR definido)
+extratores = descobrir_extratores()
+
+# Seleção do tipo de extração (só o módulo do extrator escolhido é importado)
 tipo_extracao = st.sidebar.selectbox(
     "Selecione o tipo de extração:",
-    ["Gastos de Vereadores", "Comissões e Votações", "Projetos em Tramitação"]
+    list(extratores.keys())
 )
+extrator = extratores[tipo_extracao].carregar()
 
 st.sidebar.markdown("---")
 
 # Configurações comuns
 ano_atual = datetime.now().year
-ano = st.sidebar.number_input(
-    "Ano:",
-    min_value=2020,
-    max_value=ano_atual,
-    value=ano_atual,
-    step=1
+ano = ano_atual
+if extrator.usa_ano:
+    ano = st.sidebar.number_input(
+        "Ano:",
+        min_value=2020,
+        max_value=ano_atual,
+        value=ano_atual,
+        step=1
+    )
+reprocessar = st.sidebar.checkbox(
+    "Reprocessar a partir do arquivo bruto",
+    value=False,
+    help="Reaproveita os payloads já baixados, sem acessar a rede"
+)
+perfil = st.sidebar.checkbox(
+    "Gerar perfil de execução",
+    value=False,
+    help="Registra onde o tempo da extração foi gasto (pilhas para flamegraph e tabela de hotspots)"
 )
 
-# Interface específica para cada tipo de extração
-if tipo_extracao == "Gastos de Vereadores":
-    st.header(" Extração de Gastos de Vereadores")
-    st.info("Este extrator coleta informações sobre gastos dos vereadores da Câmara Municipal de São Paulo.")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        mes_inicio = st.selectbox(
-            "Mês Inicial:",
-            range(1, 13),
-            format_func=lambda x: f"{x:02d} - {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][x-1]}"
-        )
-    
-    with col2:
-        mes_fim = st.selectbox(
-            "Mês Final:",
-            range(mes_inicio, 13),
-            format_func=lambda x: f"{x:02d} - {['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro'][x-1]}"
-        )
-    
-    if st.button("🚀 Iniciar Extração", type="primary", use_container_width=True):
-        with st.spinner(f"Extraindo dados de {mes_inicio:02d}/{ano} até {mes_fim:02d}/{ano}..."):
-            try:
-                resultado = extrair_gastos_vereadores(ano, mes_inicio, mes_fim)
-                
-                if resultado['sucesso']:
-                    st.success(f" Extração concluída com sucesso!")
-                    st.success(f" Arquivo gerado: {resultado['arquivo_excel']}")
-                    
-                    # Exibir estatísticas
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total de Registros", resultado['total_registros'])
-                    with col2:
-                        st.metric("Vereadores", resultado['total_vereadores'])
-                    with col3:
-                        st.metric("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
-                    
-                    # Visualizar preview dos dados
-                    if os.path.exists(resultado['arquivo_excel']):
-                        df_preview = pd.read_excel(resultado['arquivo_excel'])
-                        st.subheader(" Preview dos Dados")
-                        st.dataframe(df_preview.head(50), use_container_width=True)
-                        
-                        # Botão de download
-                        with open(resultado['arquivo_excel'], 'rb') as f:
-                            st.download_button(
-                                label=" Baixar Planilha Excel",
-                                data=f,
-                                file_name=os.path.basename(resultado['arquivo_excel']),
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            )
-                else:
-                    st.error(f" Erro na extração: {resultado['erro']}")
-                    
-            except Exception as e:
-                st.error(f" Erro inesperado: {str(e)}")
-
-elif tipo_extracao == "Comissões e Votações":
-    st.header(" Extração de Comissões e Votações")
-    st.info("Este extrator coleta informações sobre comissões e votações de projetos dos vereadores.")
-    
-    # Lista de tipos de projeto
-    tipos_projeto = {
-        "Todos": "TODOS",
-        "PL - Projeto de Lei": "PL",
-        "PDL - Projeto de Decreto Legislativo": "PDL",
-    }
-    
-    tipo_selecionado = st.sidebar.selectbox(
-        "Tipo de Projeto:",
-        options=list(tipos_projeto.keys()),
-        help="Selecione o tipo de projeto ou 'Todos' para extrair todos os tipos"
-    )
-    
-    tipo_projeto = tipos_projeto[tipo_selecionado]
-    
-    # Mostrar info sobre a seleção
-    if tipo_projeto == "TODOS":
-        st.warning(" Todos os tipos de projet foram selecionados, a extração pode demorar um pouco mais que o normal")
-        st.info(f" Serão extraídos {len(tipos_projeto) - 1} tipos de projetos do ano {ano}")
-    else:
-        st.info(f"Extraindo dados de {tipo_selecionado} do ano {ano}")
-    
-    if st.button(" Iniciar Extração", type="primary", use_container_width=True):
-        with st.spinner(f"Extraindo dados..."):
-            try:
-                resultado = extrair_comissoes_votacoes(ano, tipo_projeto)
-                
-                if resultado['sucesso']:
-                    st.success(f"Extração concluída com sucesso!")
-                    
-                    if tipo_projeto == "TODOS":
-                        st.success(f"{resultado['total_tipos']} tipos de projetos foram extraídos!")
-                        st.success(f" Arquivo consolidado: {resultado['arquivo_excel']}")
-                    else:
-                        st.success(f" Arquivo gerado: {resultado['arquivo_excel']}")
-                    
+# Interface específica do extrator selecionado
+st.header(extrator.titulo)
+st.info(extrator.descricao)
+
+parametros = extrator.formulario(st, ano)
+
+if st.button("🚀 Iniciar Extração", type="primary", use_container_width=True):
+    contar("app_extracoes_solicitadas_total", extrator=extrator.nome)
+    with st.spinner(extrator.mensagem_progresso(ano, parametros)):
+        try:
+            resultado = extrator.extrair(ano, reprocessar=reprocessar, perfil=perfil, **parametros)
+
+            if resultado['sucesso']:
+                st.success(f" Extração concluída com sucesso!")
+                for mensagem in extrator.mensagens_sucesso(resultado):
+                    st.success(mensagem)
+
+                # Exibir estatísticas
+                metricas = extrator.metricas(resultado)
+                for coluna, (rotulo, valor) in zip(st.columns(len(metricas)), metricas):
+                    with coluna:
+                        st.metric(rotulo, valor)
+
+                # Visualizar preview dos dados
+                if os.path.exists(resultado['arquivo_excel']):
+                    import pandas as pd
+
+                    df_preview = pd.read_excel(resultado['arquivo_excel'])
+                    st.subheader(" Preview dos Dados")
+                    st.dataframe(df_preview.head(50), use_container_width=True)
+
+                    extrator.estatisticas_preview(st, df_preview)
+
+                    # Botão de download
+                    with open(resultado['arquivo_excel'], 'rb') as f:
+                        st.download_button(
+                            label=" Baixar Planilha Excel",
+                            data=f,
+                            file_name=os.path.basename(resultado['arquivo_excel']),
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                        )
+
+                # Perfil de execução
+                if resultado.get('arquivo_hotspots') and os.path.exists(resultado['arquivo_hotspots']):
+                    st.subheader(" Perfil de Execução")
+                    with open(resultado['arquivo_hotspots'], encoding='utf-8') as f:
+                        st.code(f.read())
+
                     col1, col2 = st.columns(2)
                     with col1:
-                        st.metric("Total de Registros", resultado['total_registros'])
-                    with col2:
-                        st.metric("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
-                    
-                    # Visualizar preview
-                    if os.path.exists(resultado['arquivo_excel']):
-                        df_preview = pd.read_excel(resultado['arquivo_excel'])
-                        st.subheader(" Preview dos Dados")
-                        st.dataframe(df_preview.head(50), use_container_width=True)
-                        
-                        # Estatísticas adicionais
-                        if 'Parlamentar' in df_preview.columns:
-                            st.subheader(" Estatísticas")
-                            col1, col2 = st.columns(2)
-                            with col1:
-                                st.metric("Total de Parlamentares", df_preview['Parlamentar'].nunique())
-                            with col2:
-                                if 'Comissão' in df_preview.columns:
-                                    st.metric("Total de Comissões", df_preview['Comissão'].nunique())
-                        
-                        with open(resultado['arquivo_excel'], 'rb') as f:
+                        with open(resultado['arquivo_perfil'], 'rb') as f:
                             st.download_button(
-                                label=" Baixar Planilha Excel",
+                                label=" Baixar Pilhas (flamegraph)",
                                 data=f,
-                                file_name=os.path.basename(resultado['arquivo_excel']),
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                                file_name=os.path.basename(resultado['arquivo_perfil']),
+                                mime="text/plain"
                             )
-                else:
-                    st.error(f" Erro na extração: {resultado['erro']}")
-                    
-            except Exception as e:
-                st.error(f" Erro inesperado: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
-
-elif tipo_extracao == "Projetos em Tramitação":
-    st.header(" Extração de Projetos em Tramitação")
-    st.info("Este extrator coleta informações sobre projetos em tramitação na Câmara Municipal.")
-    
-    tipo_projeto = st.sidebar.text_input(
-        "Tipo de Projeto:",
-        value="PL",
-        help="Ex: PL, PDL, PEC, etc."
-    )
-    
-    if st.button("🚀 Iniciar Extração", type="primary", use_container_width=True):
-        with st.spinner(f"Extraindo dados de {tipo_projeto} do ano {ano}..."):
-            try:
-                resultado = extrair_projetos_tramitacao(ano, tipo_projeto)
-                
-                if resultado['sucesso']:
-                    st.success(f" Extração concluída com sucesso!")
-                    st.success(f" Arquivo gerado: {resultado['arquivo_excel']}")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Total de Projetos", resultado['total_projetos'])
                     with col2:
-                        st.metric("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
-                    
-                    # Visualizar preview
-                    if os.path.exists(resultado['arquivo_excel']):
-                        df_preview = pd.read_excel(resultado['arquivo_excel'])
-                        st.subheader(" Preview dos Dados")
-                        st.dataframe(df_preview.head(50), use_container_width=True)
-                        
-                        with open(resultado['arquivo_excel'], 'rb') as f:
+                        with open(resultado['arquivo_hotspots'], 'rb') as f:
                             st.download_button(
-                                label=" Baixar Planilha Excel",
+                                label=" Baixar Hotspots",
                                 data=f,
-                                file_name=os.path.basename(resultado['arquivo_excel']),
-                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                                file_name=os.path.basename(resultado['arquivo_hotspots']),
+                                mime="text/plain"
                             )
-                else:
-                    st.error(f"Erro na extração: {resultado['erro']}")
-                    
-            except Exception as e:
-                st.error(f" Erro inesperado: {str(e)}")
+            else:
+                st.error(f" Erro na extração: {resultado['erro']}")
+
+        except Exception as e:
+            contar("app_erros_total", extrator=extrator.nome)
+            log.exception("Erro inesperado na interface", extra={"extrator": extrator.nome})
+            st.error(f" Erro inesperado: {str(e)}")
+            import traceback
+            st.code(traceback.format_exc())
 
 # Rodapé
 st.markdown("---")
@@ -0,0 +1,174 @@
+import json
+import gzip
+import hashlib
+import os
+import threading
+from datetime import datetime
+from time import perf_counter
+from extratores import metricas
+from extratores.log import obter_logger
+
+log = obter_logger(__name__)
+
+DIRETORIO_ARQUIVO = "resultados/arquivo_bruto"
+
+_trava_indice = threading.Lock()
+_cache_indices = {}
+
+
+class RespostaArquivada:
+    """Resposta servida a partir do arquivo bruto (mesma interface usada de requests.Response)"""
+
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+
+
+def _chave_parametros(parametros):
+    """Serializa os parâmetros de forma canônica para indexação"""
+    return json.dumps({str(k): str(v) for k, v in (parametros or {}).items()}, sort_keys=True)
+
+
+def _caminho_objeto(hash_conteudo, diretorio_arquivo=DIRETORIO_ARQUIVO):
+    """Caminho do objeto comprimido correspondente a um hash"""
+    return os.path.join(diretorio_arquivo, "objetos", hash_conteudo[:2], f"{hash_conteudo}.gz")
+
+
+def _caminho_indice(diretorio_arquivo=DIRETORIO_ARQUIVO):
+    """Caminho do índice de buscas"""
+    return os.path.join(diretorio_arquivo, "indice.jsonl")
+
+
+def arquivar_payload(endpoint, parametros, conteudo, diretorio_arquivo=DIRETORIO_ARQUIVO):
+    """
+    Armazena um payload bruto no arquivo endereçado por conteúdo
+
+    O conteúdo é gravado comprimido uma única vez por hash (SHA-256); cada busca
+    acrescenta uma entrada no índice com (endpoint, parâmetros, data da busca).
+
+    Args:
+        endpoint (str): URL consultada, sem parâmetros
+        parametros (dict): Parâmetros da consulta
+        conteudo (bytes): Corpo da resposta
+        diretorio_arquivo (str): Raiz do arquivo bruto
+
+    Returns:
+        str: Hash do conteúdo armazenado
+    """
+    hash_conteudo = hashlib.sha256(conteudo).hexdigest()
+    caminho_objeto = _caminho_objeto(hash_conteudo, diretorio_arquivo)
+
+    if not os.path.exists(caminho_objeto):
+        os.makedirs(os.path.dirname(caminho_objeto), exist_ok=True)
+        caminho_temporario = f"{caminho_objeto}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with gzip.open(caminho_temporario, "wb") as f:
+            f.write(conteudo)
+        os.replace(caminho_temporario, caminho_objeto)
+
+    entrada = {
+        "endpoint": endpoint,
+        "parametros": _chave_parametros(parametros),
+        "hash": hash_conteudo,
+        "buscado_em": datetime.now().isoformat(timespec="seconds"),
+        "tamanho": len(conteudo)
+    }
+    with _trava_indice:
+        os.makedirs(diretorio_arquivo, exist_ok=True)
+        with open(_caminho_indice(diretorio_arquivo), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+
+    return hash_conteudo
+
+
+def _carregar_indice(diretorio_arquivo=DIRETORIO_ARQUIVO):
+    """Lê o índice e mapeia (endpoint, parâmetros) para o hash mais recente, reaproveitando a leitura anterior se o arquivo não mudou"""
+    caminho_indice = _caminho_indice(diretorio_arquivo)
+    try:
+        estado = os.stat(caminho_indice)
+    except FileNotFoundError:
+        return {}
+
+    assinatura = (estado.st_mtime_ns, estado.st_size)
+    em_cache = _cache_indices.get(caminho_indice)
+    if em_cache is not None and em_cache[0] == assinatura:
+        return em_cache[1]
+
+    mais_recentes = {}
+    with open(caminho_indice, encoding="utf-8") as f:
+        for linha in f:
+            try:
+                entrada = json.loads(linha)
+            except ValueError:
+                continue
+            mais_recentes[(entrada["endpoint"], entrada["parametros"])] = entrada["hash"]
+
+    _cache_indices[caminho_indice] = (assinatura, mais_recentes)
+    return mais_recentes
+
+
+def buscar_payload(endpoint, parametros, diretorio_arquivo=DIRETORIO_ARQUIVO):
+    """
+    Recupera o payload mais recente arquivado para (endpoint, parâmetros)
+
+    Returns:
+        bytes: Conteúdo descomprimido, ou None se não houver entrada no índice
+    """
+    hash_conteudo = _carregar_indice(diretorio_arquivo).get((endpoint, _chave_parametros(parametros)))
+    if hash_conteudo is None:
+        return None
+
+    try:
+        with gzip.open(_caminho_objeto(hash_conteudo, diretorio_arquivo), "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def requisitar(endpoint, parametros=None, timeout=60, reprocessar=False):
+    """
+    Busca um endpoint arquivando o payload bruto, ou o relê do arquivo sem rede
+
+    Args:
+        endpoint (str): URL a consultar
+        parametros (dict): Parâmetros da consulta
+        timeout (int): Timeout da requisição em segundos
+        reprocessar (bool): Se True, não acessa a rede e usa o payload arquivado
+
+    Returns:
+        Objeto com atributos status_code e content
+    """
+    rotulo = metricas.rotulo_endpoint(endpoint)
+    extrator = metricas.extrator_atual.get()
+
+    if reprocessar:
+        conteudo = buscar_payload(endpoint, parametros)
+        if conteudo is None:
+            metricas.contar("arquivo_bruto_total", endpoint=rotulo, resultado="falta")
+            log.warning(
+                "Payload não encontrado no arquivo bruto",
+                extra={"endpoint": endpoint, "parametros": _chave_parametros(parametros)}
+            )
+            return RespostaArquivada(404, b"")
+        metricas.contar("arquivo_bruto_total", endpoint=rotulo, resultado="acerto")
+        return RespostaArquivada(200, conteudo)
+
+    import requests
+    
+    inicio = perf_counter()
+    try:
+        resposta = requests.get(endpoint, params=parametros, timeout=timeout)
+    except Exception:
+        metricas.contar("requisicoes_total", endpoint=rotulo, status="falha")
+        raise
+    finally:
+        duracao = perf_counter() - inicio
+        metricas.observar("requisicao_segundos", duracao, endpoint=rotulo)
+        metricas.observar("etapa_segundos", duracao, extrator=extrator, etapa="busca")
+
+    metricas.contar("requisicoes_total", endpoint=rotulo, status=resposta.status_code)
+    if resposta.status_code == 200:
+        try:
+            arquivar_payload(endpoint, parametros, resposta.content)
+        except Exception as e:
+            log.error("Erro ao arquivar payload bruto", extra={"endpoint": endpoint, "erro": str(e)})
+    return resposta
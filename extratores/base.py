@@ -0,0 +1,133 @@
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from extratores.arquivo_bruto import requisitar
+from extratores.log import obter_logger
+from extratores.metricas import medir, medir_extracao
+
+log = obter_logger(__name__)
+
+
+def criar_diretorio(nome_diretorio):
+    """Cria diretório se não existir"""
+    try:
+        os.makedirs(nome_diretorio, exist_ok=True)
+    except Exception as e:
+        log.error("Erro ao criar diretório", extra={"diretorio": nome_diretorio, "erro": str(e)})
+
+
+# Etapa de busca: todas as requisições passam pelo arquivo bruto
+buscar = requisitar
+
+
+def decodificar_json(resposta):
+    """Etapa de parse: decodifica o corpo JSON de uma resposta"""
+    with medir("parse"):
+        return json.loads(resposta.content)
+
+
+def escrever_csv(caminho_arquivo, linhas, cabecalho):
+    """Escreve linhas no arquivo CSV, criando-o com cabeçalho se ainda não existir"""
+    novo = not os.path.exists(caminho_arquivo)
+    try:
+        with open(caminho_arquivo, "w" if novo else "a", newline="") as f:
+            writer = csv.writer(f)
+            if novo:
+                writer.writerow(cabecalho)
+            writer.writerows(linhas)
+    except Exception as e:
+        log.error("Erro ao escrever arquivo", extra={"arquivo": caminho_arquivo, "erro": str(e)})
+
+
+class ChaveProjeto(namedtuple("ChaveProjeto", ["tipo", "numero", "ano"])):
+    """Chave tipada de um projeto: (tipo, número, ano), exibida como "{tipo} {numero}/{ano}" """
+    __slots__ = ()
+
+    @classmethod
+    def de_registro(cls, registro):
+        return cls(str(registro['tipo']).strip(), int(registro['numero']), int(registro['ano']))
+
+    @classmethod
+    def tentar_de_registro(cls, registro):
+        """Como de_registro, mas registra um aviso e retorna None se tipo, número ou ano faltarem ou forem inválidos"""
+        try:
+            return cls.de_registro(registro)
+        except (KeyError, TypeError, ValueError) as e:
+            log.warning(
+                "Registro de projeto ignorado: chave inválida",
+                extra={"registro": {campo: registro.get(campo) for campo in cls._fields}, "erro": repr(e)}
+            )
+            return None
+
+    def __str__(self):
+        return f"{self.tipo} {self.numero}/{self.ano}"
+
+
+class ColetorCSV:
+    """
+    Etapa de escrita: acumula linhas por arquivo e grava cada arquivo de uma vez
+
+    Substitui a abertura do arquivo a cada linha por uma única escrita por
+    arquivo a cada chamada de gravar().
+    """
+
+    def __init__(self, cabecalho):
+        self.cabecalho = cabecalho
+        self._linhas = {}
+
+    def adicionar(self, caminho_arquivo, linhas):
+        self._linhas.setdefault(caminho_arquivo, []).extend(linhas)
+
+    def gravar(self):
+        with medir("escrita"):
+            for caminho_arquivo, linhas in self._linhas.items():
+                escrever_csv(caminho_arquivo, linhas, self.cabecalho)
+        self._linhas = {}
+
+
+class Extrator(ABC):
+    """
+    Interface comum dos extratores exibidos no app
+
+    Cada módulo de extratores/ que define EXTRATOR = <subclasse>() é
+    descoberto automaticamente por extratores.registro, que lê nome, titulo,
+    descricao e ordem do código-fonte sem importar o módulo; por isso esses
+    atributos devem ser literais. O módulo só é importado quando o extrator é
+    selecionado, e dependências pesadas (pandas, bs4) continuam sendo
+    importadas dentro das funções que as usam.
+    """
+
+    nome = ""
+    titulo = ""
+    descricao = ""
+    ordem = 100
+    # False para extratores cujo formulário tem seus próprios campos de ano
+    usa_ano = True
+
+    def formulario(self, st, ano):
+        """Desenha os campos específicos do extrator e retorna os parâmetros escolhidos"""
+        return {}
+
+    def mensagem_progresso(self, ano, parametros):
+        return "Extraindo dados..."
+
+    @abstractmethod
+    def executar(self, ano, reprocessar=False, perfil=False, **parametros):
+        """Executa a extração e retorna o dicionário de resultado"""
+
+    def extrair(self, ano, reprocessar=False, perfil=False, **parametros):
+        """Chama executar com o nome do extrator como rótulo das métricas da extração"""
+        return medir_extracao(self.nome, self.executar, ano, reprocessar=reprocessar, perfil=perfil, **parametros)
+
+    def mensagens_sucesso(self, resultado):
+        return [f" Arquivo gerado: {resultado['arquivo_excel']}"]
+
+    def metricas(self, resultado):
+        """Lista de (rótulo, valor) exibida após a extração"""
+        return [("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")]
+
+    def estatisticas_preview(self, st, df_preview):
+        """Estatísticas adicionais sobre o preview dos dados (opcional)"""
+        pass
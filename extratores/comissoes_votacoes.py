@@ -1,53 +1,41 @@
-import requests
-import json
 import csv
 import glob
 import os
-import pandas as pd
 from time import perf_counter
+from extratores.base import ColetorCSV, Extrator, buscar, criar_diretorio, decodificar_json
+from extratores.matriz_votos import VOTO_PENDENTE, MatrizVotos
+from extratores.ordenacao_externa import OrdenadorExterno
+from extratores.perfil import com_perfil
+from extratores.execucao import DIRETORIO_RESULTADOS, area_trabalho, execucao_unica, publicar
+from extratores.log import obter_logger
+from extratores.metricas import medir
 
-def criar_diretorio(nome_diretorio):
-    """Cria diretório se não existir"""
-    try:
-        os.makedirs(nome_diretorio, exist_ok=True)
-    except Exception as e:
-        print(f"Erro ao criar diretório: {e}")
+log = obter_logger(__name__)
 
-def escrever_info_vereador(caminho_arquivo, dados, cabecalho):
-    """Escreve informações do vereador no arquivo CSV"""
-    if len(glob.glob(caminho_arquivo)) > 0:
-        try:
-            with open(caminho_arquivo, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerows(dados)
-        except Exception as e:
-            print(f"Erro ao escrever no arquivo existente: {e}")
-    else:
-        try:
-            with open(caminho_arquivo, "w", newline="") as f:
-                dados.insert(0, cabecalho)
-                writer = csv.writer(f)
-                writer.writerows(dados)
-        except Exception as e:
-            print(f"Erro ao criar novo arquivo: {e}")
+API_COMISSOES = 'https://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/ProjetosReunioesDeComissaoJSON'
 
-def coleta_info_vereador(info_vereador_encaminhamentos, cabecalho, infos_projeto, nome_diretorio):
-    """Coleta informações de votação dos vereadores"""
+def coleta_info_vereador(info_vereador_encaminhamentos, coletor, infos_projeto, nome_diretorio, matriz=None):
+    """Coleta informações de votação dos vereadores (e, se informada, alimenta a matriz de votos)"""
     for encaminhamento in info_vereador_encaminhamentos:
         if encaminhamento.get("comissoes") is not None:
             for comissao in encaminhamento["comissoes"]:
+                voto = comissao.get("conclusao", VOTO_PENDENTE)
                 dados = []
                 dados.append([
                     comissao["nome"],
                     comissao["nomePolitico"],
                     infos_projeto,
-                    comissao.get("conclusao", "Aguarda votação pela comissão")
+                    voto
                 ])
+                if matriz is not None:
+                    matriz.adicionar(comissao["nome"], comissao["nomePolitico"], infos_projeto, voto)
                 caminho_arquivo = f"{nome_diretorio}/{comissao['nomePolitico']}.csv"
-                escrever_info_vereador(caminho_arquivo, dados, cabecalho)
+                coletor.adicionar(caminho_arquivo, dados)
 
 def gerar_planilha_agregada(diretorio_dados, tipo, ano, diretorio_planilhas):
     """Gera planilha agregada com todos os dados"""
+    import pandas as pd
+    
     arquivos_csv = [i for i in glob.glob(f"{diretorio_dados}/*.csv")]
     
     if len(arquivos_csv) == 0:
@@ -62,19 +50,100 @@ def gerar_planilha_agregada(diretorio_dados, tipo, ano, diretorio_planilhas):
     df_comissoes_votacoes = pd.read_csv(caminho_csv_combinado)
     df_comissoes_votacoes = df_comissoes_votacoes.sort_values(by='Parlamentar')
     
-    with pd.ExcelWriter(caminho_excel_agregado, mode="w", engine="openpyxl") as writer:
-        df_comissoes_votacoes.to_excel(writer, sheet_name="Folha1", index=False)
+    with medir("planilha"):
+        with pd.ExcelWriter(caminho_excel_agregado, mode="w", engine="openpyxl") as writer:
+            df_comissoes_votacoes.to_excel(writer, sheet_name="Folha1", index=False)
     
-    print("Planilha agregada gerada com sucesso!")
+    log.info("Planilha agregada gerada com sucesso", extra={"arquivo": caminho_excel_agregado})
     return caminho_excel_agregado
 
-def extrair_comissoes_votacoes(ano, tipo_projeto):
+class ColetorOrdenado:
+    """Coletor do modo streaming: envia as linhas ao OrdenadorExterno em vez de gravar um CSV por parlamentar"""
+    
+    def __init__(self, ordenador):
+        self.ordenador = ordenador
+    
+    def adicionar(self, caminho_arquivo, linhas):
+        for linha in linhas:
+            self.ordenador.adicionar(linha)
+    
+    def gravar(self):
+        pass
+
+def gerar_planilha_agregada_streaming(ordenador, cabecalho, diretorio_dados, tipo, ano, diretorio_planilhas):
+    """
+    Gera a planilha agregada e os CSVs por parlamentar a partir das linhas ordenadas por Parlamentar
+    
+    Cada linha é escrita assim que sai da intercalação: no CSV agregado, na
+    planilha (openpyxl em modo write_only) e no CSV do parlamentar, que fica
+    aberto apenas enquanto suas linhas (contíguas) estão sendo escritas.
+    
+    Returns:
+        tuple: (caminho da planilha, total de registros) ou (None, 0) se não houver linhas
+    """
+    from openpyxl import Workbook
+    
+    if ordenador.total_linhas == 0:
+        return None, 0
+    
+    nome_base = "comissoes_votacoes_agregada"
+    caminho_csv_combinado = f"{diretorio_planilhas}/{nome_base}_{tipo}_{ano}.csv"
+    caminho_excel_agregado = f"{diretorio_planilhas}/{nome_base}_{tipo}_{ano}.xlsx"
+    
+    planilha = Workbook(write_only=True)
+    folha = planilha.create_sheet("Folha1")
+    folha.append(cabecalho)
+    
+    total_registros = 0
+    parlamentar_atual = None
+    arquivo_parlamentar = None
+    escritor_parlamentar = None
+    
+    try:
+        with open(caminho_csv_combinado, "w", newline="") as f:
+            escritor_combinado = csv.writer(f)
+            escritor_combinado.writerow(cabecalho)
+            
+            for linha in ordenador.ordenadas():
+                if linha[1] != parlamentar_atual:
+                    if arquivo_parlamentar is not None:
+                        arquivo_parlamentar.close()
+                    parlamentar_atual = linha[1]
+                    arquivo_parlamentar = open(f"{diretorio_dados}/{parlamentar_atual}.csv", "w", newline="")
+                    escritor_parlamentar = csv.writer(arquivo_parlamentar)
+                    escritor_parlamentar.writerow(cabecalho)
+                
+                escritor_parlamentar.writerow(linha)
+                escritor_combinado.writerow(linha)
+                folha.append(linha)
+                total_registros += 1
+    finally:
+        if arquivo_parlamentar is not None:
+            arquivo_parlamentar.close()
+    
+    with medir("planilha"):
+        planilha.save(caminho_excel_agregado)
+    
+    log.info("Planilha agregada gerada com sucesso", extra={"arquivo": caminho_excel_agregado, "total": total_registros})
+    return caminho_excel_agregado, total_registros
+
+@execucao_unica
+@com_perfil
+def extrair_comissoes_votacoes(ano, tipo_projeto, reprocessar=False, perfil=False, modo_streaming=False, orcamento_memoria_mb=64):
     """
     Extrai informações sobre comissões e votações
     
     Args:
         ano (int): Ano para extração
         tipo_projeto (str): Tipo de projeto (PL, PDL, etc) ou "TODOS"
+        reprocessar (bool): Reprocessa a partir do arquivo bruto, sem acesso à rede
+        perfil (bool): Grava um perfil de execução ao lado da planilha
+        modo_streaming (bool): Processa um tipo por vez e ordena por Parlamentar em disco,
+            escrevendo as saídas incrementalmente; neste modo a matriz de votos (.npz)
+            não é gerada
+        orcamento_memoria_mb (int): Memória máxima do buffer de ordenação no modo streaming.
+            Cobre apenas as linhas em buffer: o JSON decodificado de um tipo de projeto
+            também fica inteiro em memória enquanto esse tipo é processado
     
     Returns:
         dict: Dicionário com resultado da extração
@@ -82,105 +151,240 @@ def extrair_comissoes_votacoes(ano, tipo_projeto):
     inicio = perf_counter()
     
     try:
-        CABECALHO = ["Comissão", "Parlamentar", "Projeto/Requerimento", "Voto"]
-        URL = 'https://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/ProjetosReunioesDeComissaoJSON'
-        
-        # Se for "TODOS", processar todos os tipos
-        if tipo_projeto == "TODOS":
-            tipos_para_extrair = ["PL", "PDL", "PEC", "PRC", "REQ", "IND", "MOC", "SUB"]
-            print(f"Extraindo TODOS os tipos de projeto: {tipos_para_extrair}")
-        else:
-            tipos_para_extrair = [tipo_projeto]
-        
-        # Diretórios base
-        diretorio_base_dados = f"resultados/dados-TODOS-{ano}" if tipo_projeto == "TODOS" else f"resultados/dados-{tipo_projeto}-{ano}"
-        diretorio_base_planilhas = f"resultados/planilhas-TODOS-{ano}" if tipo_projeto == "TODOS" else f"resultados/planilhas-{tipo_projeto}-{ano}"
-        
-        criar_diretorio(diretorio_base_dados)
-        criar_diretorio(diretorio_base_planilhas)
+        with area_trabalho(f"comissoes-{tipo_projeto}-{ano}") as trabalho:
+            return _extrair_comissoes_em_area(trabalho, ano, tipo_projeto, reprocessar, inicio, modo_streaming, orcamento_memoria_mb)
+    except Exception as e:
+        return {
+            'sucesso': False,
+            'erro': str(e)
+        }
+
+def _extrair_comissoes_em_area(trabalho, ano, tipo_projeto, reprocessar, inicio, modo_streaming=False, orcamento_memoria_mb=64):
+    """Executa a extração de comissões dentro de uma área de trabalho isolada e publica o resultado"""
+    CABECALHO = ["Comissão", "Parlamentar", "Projeto/Requerimento", "Voto"]
+    
+    # Se for "TODOS", processar todos os tipos
+    if tipo_projeto == "TODOS":
+        tipos_para_extrair = ["PL", "PDL", "PEC", "PRC", "REQ", "IND", "MOC", "SUB"]
+        log.info("Extraindo TODOS os tipos de projeto", extra={"tipos": tipos_para_extrair})
+    else:
+        tipos_para_extrair = [tipo_projeto]
+    
+    # Diretórios base (na área de trabalho isolada) e destinos publicados
+    nome_dados = f"dados-{tipo_projeto}-{ano}"
+    nome_planilhas = f"planilhas-{tipo_projeto}-{ano}"
+    diretorio_base_dados = os.path.join(trabalho, nome_dados)
+    diretorio_base_planilhas = os.path.join(trabalho, nome_planilhas)
+    
+    criar_diretorio(diretorio_base_dados)
+    criar_diretorio(diretorio_base_planilhas)
+    
+    todos_dados_ok = False
+    tipos_processados = 0
+    
+    # A matriz guarda todos os votos em memória e não caberia no orçamento do modo streaming
+    matriz = None if modo_streaming else MatrizVotos()
+    
+    if modo_streaming:
+        diretorio_blocos = os.path.join(trabalho, "blocos")
+        criar_diretorio(diretorio_blocos)
+        ordenador = OrdenadorExterno(
+            chave=lambda linha: linha[1],
+            diretorio=diretorio_blocos,
+            orcamento_bytes=orcamento_memoria_mb * 1024 * 1024
+        )
+        coletor = ColetorOrdenado(ordenador)
+    else:
+        coletor = ColetorCSV(CABECALHO)
+    
+    # Processar cada tipo de projeto
+    for tipo_atual in tipos_para_extrair:
+        parametros = {
+            'ano': str(ano),
+            'tipo': str(tipo_atual)
+        }
         
-        todos_dados_ok = False
-        tipos_processados = 0
+        dados_ok = False
+        log.info("Consultando API de comissões", extra={"tipo": tipo_atual, "ano": ano})
         
-        # Processar cada tipo de projeto
-        for tipo_atual in tipos_para_extrair:
-            parametros = {
-                'ano': str(ano),
-                'tipo': str(tipo_atual)
-            }
-            
-            dados_ok = False
-            print(f"Consultando API para {tipo_atual} do ano {ano}...")
+        try:
+            resposta = buscar(API_COMISSOES, parametros, timeout=60, reprocessar=reprocessar)
             
-            try:
-                resposta = requests.get(URL, params=parametros, timeout=60)
+            if resposta.status_code == 200:
+                resposta_obj = decodificar_json(resposta)
                 
-                if resposta.status_code == 200:
-                    resposta_obj = json.loads(resposta.content)
-                    
-                    if len(resposta_obj) == 0:
-                        print(f"Nenhum dado encontrado para {tipo_atual} do ano {ano}")
-                        continue
-                    
-                    for registro in resposta_obj:
-                        infos_projeto = f"{registro['tipo']} {registro['numero']}/{registro['ano']}"
-                        if registro.get("encaminhamentos") is not None:
-                            coleta_info_vereador(
-                                info_vereador_encaminhamentos=registro["encaminhamentos"],
-                                cabecalho=CABECALHO,
-                                infos_projeto=infos_projeto,
-                                nome_diretorio=diretorio_base_dados
-                            )
-                            dados_ok = True
-                    
-                    if dados_ok:
-                        tipos_processados += 1
-                        todos_dados_ok = True
-                        print(f"✓ {tipo_atual} extraído com sucesso!")
-                else:
-                    print(f"Erro ao consultar {tipo_atual}. Status code: {resposta.status_code}")
-                    
-            except Exception as e:
-                print(f"Erro ao processar {tipo_atual}: {str(e)}")
-                continue
-        
-        # Gerar planilha agregada
-        if todos_dados_ok:
-            nome_final = "TODOS" if tipo_projeto == "TODOS" else tipo_projeto
-            arquivo_excel = gerar_planilha_agregada(diretorio_base_dados, nome_final, ano, diretorio_base_planilhas)
-            
-            if arquivo_excel is None:
-                return {
-                    'sucesso': False,
-                    'erro': 'Não foi possível gerar a planilha agregada'
-                }
-            
-            # Estatísticas
-            df = pd.read_excel(arquivo_excel)
-            total_registros = len(df)
-            
-            fim = perf_counter()
-            tempo_execucao = fim - inicio
-            
-            resultado = {
-                'sucesso': True,
-                'arquivo_excel': arquivo_excel,
-                'total_registros': total_registros,
-                'tempo_execucao': tempo_execucao
-            }
-            
-            if tipo_projeto == "TODOS":
-                resultado['total_tipos'] = tipos_processados
-            
-            return resultado
+                if len(resposta_obj) == 0:
+                    log.warning("Nenhum dado encontrado", extra={"tipo": tipo_atual, "ano": ano})
+                    continue
+                
+                for registro in resposta_obj:
+                    infos_projeto = f"{registro['tipo']} {registro['numero']}/{registro['ano']}"
+                    if registro.get("encaminhamentos") is not None:
+                        coleta_info_vereador(
+                            info_vereador_encaminhamentos=registro["encaminhamentos"],
+                            coletor=coletor,
+                            infos_projeto=infos_projeto,
+                            nome_diretorio=diretorio_base_dados,
+                            matriz=matriz
+                        )
+                        dados_ok = True
+                
+                coletor.gravar()
+                del resposta_obj
+                
+                if dados_ok:
+                    tipos_processados += 1
+                    todos_dados_ok = True
+                    log.info("Tipo extraído com sucesso", extra={"tipo": tipo_atual, "ano": ano})
+            else:
+                log.warning("Erro ao consultar API de comissões", extra={"tipo": tipo_atual, "ano": ano, "status": resposta.status_code})
+                
+        except Exception as e:
+            log.error("Erro ao processar tipo", extra={"tipo": tipo_atual, "ano": ano, "erro": str(e)})
+            continue
+    
+    # Gerar planilha agregada
+    if todos_dados_ok:
+        nome_final = "TODOS" if tipo_projeto == "TODOS" else tipo_projeto
+        if modo_streaming:
+            arquivo_excel, total_registros = gerar_planilha_agregada_streaming(
+                ordenador, CABECALHO, diretorio_base_dados, nome_final, ano, diretorio_base_planilhas
+            )
         else:
+            arquivo_excel = gerar_planilha_agregada(diretorio_base_dados, nome_final, ano, diretorio_base_planilhas)
+        
+        if arquivo_excel is None:
             return {
                 'sucesso': False,
-                'erro': f'Nenhum dado foi extraído para {tipo_projeto} do ano {ano}'
+                'erro': 'Não foi possível gerar a planilha agregada'
             }
+        
+        # Estatísticas
+        if not modo_streaming:
+            import pandas as pd
             
-    except Exception as e:
+            df = pd.read_excel(arquivo_excel)
+            total_registros = len(df)
+        
+        # Matriz de votos codificada (opcional: a planilha e os CSVs já estão prontos)
+        arquivo_matriz = None
+        if matriz is not None:
+            nome_matriz = f"comissoes_votacoes_matriz_{nome_final}_{ano}.npz"
+            try:
+                matriz.salvar(os.path.join(diretorio_base_planilhas, nome_matriz))
+                arquivo_matriz = f"{DIRETORIO_RESULTADOS}/{nome_planilhas}/{nome_matriz}"
+            except Exception as e:
+                log.error("Erro ao gravar a matriz de votos", extra={"tipo": nome_final, "ano": ano, "erro": str(e)})
+        
+        # Publicar resultados
+        publicar(diretorio_base_dados, f"{DIRETORIO_RESULTADOS}/{nome_dados}")
+        publicar(diretorio_base_planilhas, f"{DIRETORIO_RESULTADOS}/{nome_planilhas}")
+        arquivo_excel = f"{DIRETORIO_RESULTADOS}/{nome_planilhas}/{os.path.basename(arquivo_excel)}"
+        
+        fim = perf_counter()
+        tempo_execucao = fim - inicio
+        
+        resultado = {
+            'sucesso': True,
+            'arquivo_excel': arquivo_excel,
+            'arquivo_matriz': arquivo_matriz,
+            'total_registros': total_registros,
+            'tempo_execucao': tempo_execucao
+        }
+        
+        if tipo_projeto == "TODOS":
+            resultado['total_tipos'] = tipos_processados
+        
+        return resultado
+    else:
         return {
             'sucesso': False,
-            'erro': str(e)
+            'erro': f'Nenhum dado foi extraído para {tipo_projeto} do ano {ano}'
         }
+
+class ExtratorComissoes(Extrator):
+    nome = "Comissões e Votações"
+    titulo = " Extração de Comissões e Votações"
+    descricao = "Este extrator coleta informações sobre comissões e votações de projetos dos vereadores."
+    ordem = 20
+    
+    # Lista de tipos de projeto
+    TIPOS_PROJETO = {
+        "Todos": "TODOS",
+        "PL - Projeto de Lei": "PL",
+        "PDL - Projeto de Decreto Legislativo": "PDL",
+    }
+    
+    def formulario(self, st, ano):
+        tipo_selecionado = st.sidebar.selectbox(
+            "Tipo de Projeto:",
+            options=list(self.TIPOS_PROJETO.keys()),
+            help="Selecione o tipo de projeto ou 'Todos' para extrair todos os tipos"
+        )
+        
+        tipo_projeto = self.TIPOS_PROJETO[tipo_selecionado]
+        
+        # Mostrar info sobre a seleção
+        if tipo_projeto == "TODOS":
+            st.warning(" Todos os tipos de projet foram selecionados, a extração pode demorar um pouco mais que o normal")
+            st.info(f" Serão extraídos {len(self.TIPOS_PROJETO) - 1} tipos de projetos do ano {ano}")
+        else:
+            st.info(f"Extraindo dados de {tipo_selecionado} do ano {ano}")
+        
+        modo_streaming = st.sidebar.checkbox(
+            "Modo streaming (memória limitada)",
+            value=False,
+            help="Processa um tipo por vez e ordena em disco; indicado para TODOS em máquinas com pouca memória. Não gera a matriz de votos (.npz)"
+        )
+        orcamento_memoria_mb = 64
+        if modo_streaming:
+            orcamento_memoria_mb = st.sidebar.number_input(
+                "Orçamento de memória (MB):",
+                min_value=8,
+                max_value=4096,
+                value=64,
+                step=8,
+                help="Limita o buffer de ordenação; a resposta da API de um tipo de projeto também fica em memória enquanto é processada"
+            )
+        
+        return {
+            'tipo_projeto': tipo_projeto,
+            'modo_streaming': modo_streaming,
+            'orcamento_memoria_mb': int(orcamento_memoria_mb)
+        }
+    
+    def executar(self, ano, reprocessar=False, perfil=False, **parametros):
+        return extrair_comissoes_votacoes(
+            ano,
+            parametros['tipo_projeto'],
+            reprocessar,
+            perfil,
+            modo_streaming=parametros.get('modo_streaming', False),
+            orcamento_memoria_mb=parametros.get('orcamento_memoria_mb', 64)
+        )
+    
+    def mensagens_sucesso(self, resultado):
+        if 'total_tipos' in resultado:
+            return [
+                f"{resultado['total_tipos']} tipos de projetos foram extraídos!",
+                f" Arquivo consolidado: {resultado['arquivo_excel']}"
+            ]
+        return super().mensagens_sucesso(resultado)
+    
+    def metricas(self, resultado):
+        return [
+            ("Total de Registros", resultado['total_registros']),
+            ("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
+        ]
+    
+    def estatisticas_preview(self, st, df_preview):
+        if 'Parlamentar' in df_preview.columns:
+            st.subheader(" Estatísticas")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total de Parlamentares", df_preview['Parlamentar'].nunique())
+            with col2:
+                if 'Comissão' in df_preview.columns:
+                    st.metric("Total de Comissões", df_preview['Comissão'].nunique())
+
+EXTRATOR = ExtratorComissoes()
@@ -0,0 +1,133 @@
+import functools
+import inspect
+import os
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from concurrent.futures import Future
+from contextlib import contextmanager
+from extratores import metricas
+from extratores.log import obter_logger
+
+log = obter_logger(__name__)
+
+DIRETORIO_RESULTADOS = "resultados"
+DIRETORIO_VERSOES = ".versoes"
+
+_trava_execucoes = threading.Lock()
+_execucoes_em_andamento = {}
+_trava_publicacao = threading.Lock()
+
+
+def execucao_unica(funcao):
+    """
+    Agrupa chamadas concorrentes idênticas em uma única execução
+
+    Enquanto uma extração com os mesmos argumentos estiver em andamento (por
+    exemplo, duas sessões do Streamlit pedindo o mesmo ano), as chamadas
+    seguintes aguardam e recebem o resultado da primeira.
+    """
+    assinatura = inspect.signature(funcao)
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        argumentos = assinatura.bind(*args, **kwargs)
+        argumentos.apply_defaults()
+        chave = (funcao.__module__, funcao.__qualname__, tuple(argumentos.arguments.items()))
+
+        with _trava_execucoes:
+            futuro = _execucoes_em_andamento.get(chave)
+            lider = futuro is None
+            if lider:
+                futuro = Future()
+                _execucoes_em_andamento[chave] = futuro
+
+        if not lider:
+            log.info(
+                "Aguardando extração idêntica já em andamento",
+                extra={"extrator": funcao.__name__, "argumentos": dict(argumentos.arguments)}
+            )
+            metricas.contar("execucoes_compartilhadas_total", extrator=metricas.extrator_atual.get())
+            resultado = futuro.result()
+            return dict(resultado) if isinstance(resultado, dict) else resultado
+
+        try:
+            resultado = funcao(*args, **kwargs)
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        else:
+            futuro.set_result(resultado)
+            return resultado
+        finally:
+            with _trava_execucoes:
+                _execucoes_em_andamento.pop(chave, None)
+
+    return envoltorio
+
+
+@contextmanager
+def area_trabalho(prefixo, diretorio_base=DIRETORIO_RESULTADOS):
+    """
+    Cria um diretório de trabalho isolado para uma execução e o remove ao final
+
+    O diretório fica dentro de diretorio_base para que a publicação com
+    os.replace seja atômica (mesmo sistema de arquivos).
+    """
+    os.makedirs(diretorio_base, exist_ok=True)
+    caminho = tempfile.mkdtemp(prefix=f".trabalho-{prefixo}-", dir=diretorio_base)
+    try:
+        yield caminho
+    finally:
+        shutil.rmtree(caminho, ignore_errors=True)
+
+
+def publicar(origem, destino):
+    """
+    Publica um arquivo ou diretório da área de trabalho no destino final
+
+    Arquivos são movidos com os.replace. Diretórios são publicados inteiros:
+    a versão completa é movida para .versoes/<nome>/ e o destino passa a ser
+    um link simbólico para ela, trocado com um único os.replace. Leitores veem
+    sempre o conjunto completo de uma execução (a anterior ou a nova), nunca
+    uma mistura das duas. A versão anterior é mantida até a próxima publicação.
+    Como a pasta inteira é substituída, cada destino deve pertencer a um único
+    extrator.
+
+    Returns:
+        str: Caminho de destino
+    """
+    diretorio_destino = os.path.dirname(destino) or "."
+    os.makedirs(diretorio_destino, exist_ok=True)
+
+    if not os.path.isdir(origem):
+        os.replace(origem, destino)
+        return destino
+
+    nome = os.path.basename(destino)
+    diretorio_versoes = os.path.join(diretorio_destino, DIRETORIO_VERSOES, nome)
+    os.makedirs(diretorio_versoes, exist_ok=True)
+
+    with _trava_publicacao:
+        versao = tempfile.mkdtemp(prefix=f"{datetime.now():%Y%m%dT%H%M%S}-", dir=diretorio_versoes)
+        os.replace(origem, versao)
+
+        anterior = None
+        if os.path.islink(destino):
+            anterior = os.path.realpath(destino)
+        elif os.path.isdir(destino):
+            # Diretório publicado antes das versões: passa a ser a versão anterior
+            anterior = tempfile.mkdtemp(prefix="anterior-", dir=diretorio_versoes)
+            os.replace(destino, anterior)
+
+        link_temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.link"
+        os.symlink(os.path.relpath(versao, diretorio_destino), link_temporario)
+        os.replace(link_temporario, destino)
+
+        manter = {os.path.realpath(versao), anterior}
+        for antiga in os.listdir(diretorio_versoes):
+            caminho = os.path.realpath(os.path.join(diretorio_versoes, antiga))
+            if caminho not in manter:
+                shutil.rmtree(caminho, ignore_errors=True)
+    return destino
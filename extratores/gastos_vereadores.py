@@ -1,239 +1,409 @@
-import requests
+import contextvars
 import csv
 import re
 import json
-from bs4 import BeautifulSoup
 import os
-import glob
-import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from time import perf_counter
+from extratores.base import ColetorCSV, Extrator, buscar, criar_diretorio
+from extratores.perfil import com_perfil
+from extratores.execucao import DIRETORIO_RESULTADOS, area_trabalho, execucao_unica, publicar
+from extratores.log import obter_logger
+from extratores.metricas import extrator_atual, medir, observar
 
-def criar_diretorio(nome_diretorio):
-    """Cria diretório se não existir"""
-    try:
-        os.makedirs(nome_diretorio, exist_ok=True)
-    except Exception as e:
-        print(f"Erro ao criar diretório: {e}")
+log = obter_logger(__name__)
+
+URL_GASTOS = "https://sisgvarmazenamento.blob.core.windows.net/prd/PublicacaoPortal/Arquivos/{anomes}.htm"
 
-def extrair_gastos_vereadores(ano, mes_inicio, mes_fim):
+# Meses buscados à frente enquanto o mês atual é processado
+MAX_BUSCAS_SIMULTANEAS = 4
+
+def planejar_particoes(ano_inicio, mes_inicio, ano_fim, mes_fim):
     """
-    Extrai gastos de vereadores da Câmara Municipal de São Paulo
+    Lista os meses do período, em ordem
+    
+    Returns:
+        list: Tuplas (ano, mês) de (ano_inicio, mes_inicio) até (ano_fim, mes_fim), inclusive
+    """
+    particoes = []
+    ano, mes = ano_inicio, mes_inicio
+    while (ano, mes) <= (ano_fim, mes_fim):
+        particoes.append((ano, mes))
+        ano, mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+    return particoes
+
+def buscar_mes(particao, reprocessar=False):
+    """Busca a página de gastos de um mês"""
+    ano, vmes = particao
+    return buscar(URL_GASTOS.format(anomes=f"{ano}{vmes:02d}"), timeout=30, reprocessar=reprocessar)
+
+def extrair_gastos_vereadores(ano, mes_inicio, mes_fim, reprocessar=False, perfil=False):
+    """
+    Extrai gastos de vereadores da Câmara Municipal de São Paulo em um único ano
+    
+    Equivale a extrair_gastos_periodo(ano, mes_inicio, ano, mes_fim), de modo
+    que chamadas pelas duas funções com o mesmo período são agrupadas na
+    mesma execução.
     
     Args:
         ano (int): Ano para extração
         mes_inicio (int): Mês inicial (1-12)
         mes_fim (int): Mês final (1-12)
+        reprocessar (bool): Reprocessa a partir do arquivo bruto, sem acesso à rede
+        perfil (bool): Grava um perfil de execução ao lado da planilha
+    
+    Returns:
+        dict: Dicionário com resultado da extração
+    """
+    return extrair_gastos_periodo(ano, mes_inicio, ano, mes_fim, reprocessar, perfil)
+
+@execucao_unica
+@com_perfil
+def extrair_gastos_periodo(ano_inicio, mes_inicio, ano_fim, mes_fim, reprocessar=False, perfil=False):
+    """
+    Extrai gastos de vereadores de um período que pode atravessar anos
+    
+    Os meses do período são buscados em lote (com até MAX_BUSCAS_SIMULTANEAS
+    requisições à frente do processamento) e consolidados em uma única saída.
+    
+    Args:
+        ano_inicio (int): Ano inicial
+        mes_inicio (int): Mês inicial (1-12)
+        ano_fim (int): Ano final
+        mes_fim (int): Mês final (1-12)
+        reprocessar (bool): Reprocessa a partir do arquivo bruto, sem acesso à rede
+        perfil (bool): Grava um perfil de execução ao lado da planilha
     
     Returns:
         dict: Dicionário com resultado da extração
     """
+    if ano_inicio == ano_fim:
+        sufixo = f"{ano_inicio}_{mes_inicio:02d}_{mes_fim:02d}"
+        nome_ind = f"ind_{ano_inicio}"
+    else:
+        sufixo = f"{ano_inicio}{mes_inicio:02d}_{ano_fim}{mes_fim:02d}"
+        nome_ind = f"ind_{sufixo}"
+    
+    particoes = planejar_particoes(ano_inicio, mes_inicio, ano_fim, mes_fim)
+    if len(particoes) == 0:
+        return {
+            'sucesso': False,
+            'erro': 'Período inválido: o mês final é anterior ao mês inicial.'
+        }
+    
+    return _extrair_gastos(particoes, sufixo, nome_ind, reprocessar)
+
+def _extrair_gastos(particoes, sufixo, nome_ind, reprocessar):
+    """Executa a extração dos meses planejados em uma área de trabalho isolada"""
     inicio = perf_counter()
     
     try:
-        dados_csv = []
-        dados_json = []
-        mes_dir = f"resultados/mes_{ano}"
-        ind_dir = f"resultados/ind_{ano}"
-        
-        criar_diretorio(mes_dir)
-        criar_diretorio(ind_dir)
-        
-        # Regex para remover tags HTML
-        TAG_RE = re.compile('<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});')
-        
-        def remove_tags(text):
-            return TAG_RE.sub('', text)
+        with area_trabalho(f"gastos-{sufixo}") as trabalho:
+            return _extrair_gastos_em_area(trabalho, particoes, sufixo, nome_ind, reprocessar, inicio)
+    except Exception as e:
+        return {
+            'sucesso': False,
+            'erro': str(e)
+        }
+
+def _extrair_gastos_em_area(trabalho, particoes, sufixo, nome_ind, reprocessar, inicio):
+    """Executa a extração de gastos dentro de uma área de trabalho isolada e publica o resultado"""
+    import pandas as pd
+    from bs4 import BeautifulSoup
+    
+    dados_csv = []
+    dados_json = []
+    arquivos_mes = []
+    ind_dir = os.path.join(trabalho, nome_ind)
+    
+    criar_diretorio(ind_dir)
+    
+    # Regex para remover tags HTML
+    TAG_RE = re.compile('<.*?>|&([a-z0-9]+|#[0-9]{1,6}|#x[0-9a-f]{1,6});')
+    
+    def remove_tags(text):
+        return TAG_RE.sub('', text)
+    
+    # Buscas em lote: mantém até MAX_BUSCAS_SIMULTANEAS meses sendo baixados à frente do processamento
+    # (cada busca roda em uma cópia do contexto para manter o rótulo do extrator nas métricas)
+    with ThreadPoolExecutor(max_workers=MAX_BUSCAS_SIMULTANEAS) as executor:
+        restantes = iter(particoes)
+        pendentes = deque()
+        for particao in restantes:
+            pendentes.append((particao, executor.submit(contextvars.copy_context().run, buscar_mes, particao, reprocessar)))
+            if len(pendentes) >= MAX_BUSCAS_SIMULTANEAS:
+                break
         
-        # Loop pelos meses selecionados
-        for vmes in range(mes_inicio, mes_fim + 1):
+        # Loop pelos meses planejados
+        while pendentes:
+            (ano, vmes), busca = pendentes.popleft()
+            proxima = next(restantes, None)
+            if proxima is not None:
+                pendentes.append((proxima, executor.submit(contextvars.copy_context().run, buscar_mes, proxima, reprocessar)))
+            
             mes = f"{vmes:02d}"
             mesano = mes + str(ano)
-            anomes = str(ano) + mes
-            
-            url = f"https://sisgvarmazenamento.blob.core.windows.net/prd/PublicacaoPortal/Arquivos/{anomes}.htm"
+            mes_dir = os.path.join(trabalho, f"mes_{ano}")
+            csv_filename = None
             
-            print(f"Processando {mes}/{ano}...")
+            log.info("Processando mês", extra={"ano": ano, "mes": vmes})
             
             try:
                 # Consultar o site
-                page = requests.get(url, timeout=30)
+                page = busca.result()
                 
                 if page.status_code != 200:
-                    print(f"Aviso: Mês {mes}/{ano} não disponível (Status: {page.status_code})")
+                    log.warning("Mês não disponível", extra={"ano": ano, "mes": vmes, "status": page.status_code})
                     continue
                 
+                inicio_parse = perf_counter()
                 soup = BeautifulSoup(page.content, 'html5lib')
                 
-                # Criar arquivo CSV para o mês
-                csv_filename = f"{mes_dir}/Dados{mesano}.csv"
-                f = csv.writer(open(csv_filename, 'w'))
-                f.writerow(['Vereador', 'Tipo_de_Gasto', 'Nome_Da_Empresa', 'CNPJ', 'Valor', 'Mes/Ano'])
-                
-                # Inicialização de variáveis
-                index = 0
-                start = 0
-                nomeVereador = ""
-                categoriaDespesa = ""
-                cnpj = ""
-                LugarDespesa = ""
-                skip = 0
-                ignore = 0
-                bugduplo = 1
-                
                 # Percorrer as tabelas HTML
                 name_list = soup.find('body')
                 
                 if name_list is None:
-                    print(f"Erro: Não foi possível processar o HTML do mês {mes}/{ano}")
+                    log.error("Não foi possível processar o HTML do mês", extra={"ano": ano, "mes": vmes})
                     continue
                 
-                for tr in name_list.find_all('tr'):
-                    if bugduplo == 0:
-                        bugduplo = -1
-                        continue
+                # Criar arquivo CSV para o mês (a pasta do ano só existe se algum mês for processado)
+                criar_diretorio(mes_dir)
+                csv_filename = f"{mes_dir}/Dados{mesano}.csv"
+                with open(csv_filename, 'w', newline='') as arquivo_mes:
+                    f = csv.writer(arquivo_mes)
+                    f.writerow(['Vereador', 'Tipo_de_Gasto', 'Nome_Da_Empresa', 'CNPJ', 'Valor', 'Mes/Ano'])
                     
-                    # Extração do nome do vereador
-                    if tr.find(text=re.compile(r"[\s\S]+(Vereador)\((a)\)[:\s]", re.I)):
-                        start = 1
-                        name_list_itemsp = tr.find_all('td')
-                        for name in name_list_itemsp:
-                            if name.find(text=re.compile(r"[\s\S]+(Vereador)\((a)\)", re.I)):
-                                names = str(name.contents[1])
-                                names = re.sub(r"[\s\S]+(Vereador)\((a)\)[:\s]", "", names)
-                                names = remove_tags(names)
-                                nomeVereador = names
-                                ignore = 0
-                                if bugduplo == 1:
-                                    bugduplo = 0
+                    # Inicialização de variáveis
+                    index = 0
+                    start = 0
+                    nomeVereador = ""
+                    categoriaDespesa = ""
+                    cnpj = ""
+                    LugarDespesa = ""
+                    skip = 0
+                    ignore = 0
+                    bugduplo = 1
                     
-                    if start != 0:
-                        name_list_itemsv = tr.find_all('td')
-                        for name in name_list_itemsv:
-                            names = str(name.contents[0])
-                            
-                            if skip == 1:
-                                skip = 0
-                                continue
-                            if ignore == 1:
-                                continue
-                            
-                            names = remove_tags(names)
-                            names = re.sub("(Natureza da despesa)", "", names)
-                            names = re.sub("(Valor utilizado)", "", names)
-                            names = re.sub("(VALORES GASTOS)", "", names)
-                            names = re.sub("(VALORES DISPONIBILIZADOS)", "", names)
-                            names = re.sub("(TOTAL DO ITEM)", "VXASkip", names)
-                            names = re.sub("(TOTAL DO MÊS)", "VXBSkip", names)
-                            names = re.sub("(VEREADOR AFASTADO)", "VXBSkip", names)
-                            
-                            if re.match(r"\d{2}.?\d{3}.?\d{3}/?\\d{4}-?\\d{2}", names) is not None:
-                                start = 2
-                            
-                            if re.match(r"[\s\S]*(VXASkip)", names) is not None:
-                                start = 1
-                                skip = 1
-                                continue
-                            
-                            if re.match(r"[\s\S]*(VXBSkip)", names) is not None:
-                                start = 0
-                                ignore = 1
-                                break
-                            
-                            if re.match(r'^\s*$', names):
-                                continue
-                            
-                            if start == 1:
-                                categoriaDespesa = names
-                                start = 2
-                                continue
-                            
-                            if start == 2:
-                                cnpj = names
-                                start = 3
-                                continue
-                            
-                            if start == 3:
-                                LugarDespesa = names
-                                start = 4
-                                continue
-                            
-                            if start >= 4:
-                                info_vereador_csv = [[nomeVereador, categoriaDespesa, LugarDespesa, cnpj, names, (mes + "/" + str(ano))]]
-                                info_vereador_json = {
-                                    'Vereador': nomeVereador,
-                                    'Tipo_de_Gasto': categoriaDespesa,
-                                    'Nome_Da_Empresa': LugarDespesa,
-                                    'CNPJ': cnpj,
-                                    'Valor': names,
-                                    'Mes/Ano': (mes + "/" + str(ano))
-                                }
-                                dados_csv.append(info_vereador_csv)
-                                dados_json.append(info_vereador_json)
-                                f.writerows(info_vereador_csv)
-                                start = 2
-                            
-                            start += 1
+                    for tr in name_list.find_all('tr'):
+                        if bugduplo == 0:
+                            bugduplo = -1
+                            continue
+                        
+                        # Extração do nome do vereador
+                        if tr.find(text=re.compile(r"[\s\S]+(Vereador)\((a)\)[:\s]", re.I)):
+                            start = 1
+                            name_list_itemsp = tr.find_all('td')
+                            for name in name_list_itemsp:
+                                if name.find(text=re.compile(r"[\s\S]+(Vereador)\((a)\)", re.I)):
+                                    names = str(name.contents[1])
+                                    names = re.sub(r"[\s\S]+(Vereador)\((a)\)[:\s]", "", names)
+                                    names = remove_tags(names)
+                                    nomeVereador = names
+                                    ignore = 0
+                                    if bugduplo == 1:
+                                        bugduplo = 0
+                        
+                        if start != 0:
+                            name_list_itemsv = tr.find_all('td')
+                            for name in name_list_itemsv:
+                                names = str(name.contents[0])
+                                
+                                if skip == 1:
+                                    skip = 0
+                                    continue
+                                if ignore == 1:
+                                    continue
+                                
+                                names = remove_tags(names)
+                                names = re.sub("(Natureza da despesa)", "", names)
+                                names = re.sub("(Valor utilizado)", "", names)
+                                names = re.sub("(VALORES GASTOS)", "", names)
+                                names = re.sub("(VALORES DISPONIBILIZADOS)", "", names)
+                                names = re.sub("(TOTAL DO ITEM)", "VXASkip", names)
+                                names = re.sub("(TOTAL DO MÊS)", "VXBSkip", names)
+                                names = re.sub("(VEREADOR AFASTADO)", "VXBSkip", names)
+                                
+                                if re.match(r"\d{2}.?\d{3}.?\d{3}/?\\d{4}-?\\d{2}", names) is not None:
+                                    start = 2
+                                
+                                if re.match(r"[\s\S]*(VXASkip)", names) is not None:
+                                    start = 1
+                                    skip = 1
+                                    continue
+                                
+                                if re.match(r"[\s\S]*(VXBSkip)", names) is not None:
+                                    start = 0
+                                    ignore = 1
+                                    break
+                                
+                                if re.match(r'^\s*$', names):
+                                    continue
+                                
+                                if start == 1:
+                                    categoriaDespesa = names
+                                    start = 2
+                                    continue
+                                
+                                if start == 2:
+                                    cnpj = names
+                                    start = 3
+                                    continue
+                                
+                                if start == 3:
+                                    LugarDespesa = names
+                                    start = 4
+                                    continue
+                                
+                                if start >= 4:
+                                    info_vereador_csv = [[nomeVereador, categoriaDespesa, LugarDespesa, cnpj, names, (mes + "/" + str(ano))]]
+                                    info_vereador_json = {
+                                        'Vereador': nomeVereador,
+                                        'Tipo_de_Gasto': categoriaDespesa,
+                                        'Nome_Da_Empresa': LugarDespesa,
+                                        'CNPJ': cnpj,
+                                        'Valor': names,
+                                        'Mes/Ano': (mes + "/" + str(ano))
+                                    }
+                                    dados_csv.append(info_vereador_csv)
+                                    dados_json.append(info_vereador_json)
+                                    f.writerows(info_vereador_csv)
+                                    start = 2
+                                
+                                start += 1
+                
+                arquivos_mes.append(csv_filename)
+                observar("etapa_segundos", perf_counter() - inicio_parse, extrator=extrator_atual.get(), etapa="parse")
                 
             except Exception as e:
-                print(f"Erro ao processar mês {mes}/{ano}: {str(e)}")
+                log.error("Erro ao processar mês", extra={"ano": ano, "mes": vmes, "erro": str(e)})
+                # Não publicar o CSV parcial do mês
+                if csv_filename is not None and os.path.exists(csv_filename):
+                    os.remove(csv_filename)
                 continue
+    
+    # Criar arquivos individuais por vereador (uma escrita por arquivo)
+    coletor = ColetorCSV(['Vereador', 'Tipo_de_Gasto', 'Nome_Da_Empresa', 'CNPJ', 'Valor', 'Mes/Ano'])
+    for dado in dados_csv:
+        coletor.adicionar(f"{ind_dir}/Dados_{dado[0][0]}.csv", dado)
+    coletor.gravar()
+    
+    # Consolidar apenas os CSVs gerados nesta execução
+    if len(arquivos_mes) == 0:
+        return {
+            'sucesso': False,
+            'erro': 'Nenhum dado foi extraído. Verifique se os meses selecionados têm dados disponíveis.'
+        }
+    
+    # Combinar todos os arquivos
+    combinado_csv = pd.concat([pd.read_csv(f) for f in arquivos_mes])
+    
+    # Exportar CSV consolidado
+    nome_csv_final = f"gastos_vereadores_{sufixo}.csv"
+    combinado_csv.to_csv(os.path.join(trabalho, nome_csv_final), index=False, encoding='utf-8-sig')
+    
+    # Ordenar dados
+    df_vereadores = combinado_csv.sort_values(by='Vereador')
+    
+    # Exportar para Excel
+    nome_excel = f"Gastos_Vereadores_{sufixo}.xlsx"
+    with medir("planilha"):
+        df_vereadores.to_excel(os.path.join(trabalho, nome_excel), index=False, engine='openpyxl')
+    
+    # Publicar resultados (só as pastas mes_{ano} com algum mês processado, para
+    # não substituir os meses já publicados de um ano por uma pasta vazia)
+    for mes_dir in sorted({os.path.dirname(arquivo) for arquivo in arquivos_mes}):
+        publicar(mes_dir, f"{DIRETORIO_RESULTADOS}/{os.path.basename(mes_dir)}")
+    publicar(ind_dir, f"{DIRETORIO_RESULTADOS}/{nome_ind}")
+    arquivo_csv_final = publicar(os.path.join(trabalho, nome_csv_final), f"{DIRETORIO_RESULTADOS}/{nome_csv_final}")
+    arquivo_excel = publicar(os.path.join(trabalho, nome_excel), f"{DIRETORIO_RESULTADOS}/{nome_excel}")
+    
+    fim = perf_counter()
+    tempo_execucao = fim - inicio
+    
+    # Estatísticas
+    total_registros = len(df_vereadores)
+    total_vereadores = df_vereadores['Vereador'].nunique()
+    
+    return {
+        'sucesso': True,
+        'arquivo_excel': arquivo_excel,
+        'arquivo_csv': arquivo_csv_final,
+        'total_registros': total_registros,
+        'total_vereadores': total_vereadores,
+        'total_meses': len(arquivos_mes),
+        'tempo_execucao': tempo_execucao
+    }
+
+MESES = ['Janeiro', 'Fevereiro', 'Março', 'Abril', 'Maio', 'Junho', 'Julho', 'Agosto', 'Setembro', 'Outubro', 'Novembro', 'Dezembro']
+
+class ExtratorGastos(Extrator):
+    nome = "Gastos de Vereadores"
+    titulo = " Extração de Gastos de Vereadores"
+    descricao = "Este extrator coleta informações sobre gastos dos vereadores da Câmara Municipal de São Paulo."
+    ordem = 10
+    usa_ano = False
+    
+    def formulario(self, st, ano):
+        from datetime import datetime
         
-        # Criar arquivos individuais por vereador
-        for dado in dados_csv:
-            arquivo_vereador = f"{ind_dir}/Dados_{dado[0][0]}.csv"
-            if len(glob.glob(arquivo_vereador)) > 0:
-                with open(arquivo_vereador, "a") as f:
-                    writer = csv.writer(f)
-                    writer.writerows(dado)
-            else:
-                with open(arquivo_vereador, "w") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Vereador', 'Tipo_de_Gasto', 'Nome_Da_Empresa', 'CNPJ', 'Valor', 'Mes/Ano'])
-                    writer.writerows(dado)
-        
-        # Consolidar todos os CSVs
-        tipo_arquivo = 'csv'
-        todos_csv = [i for i in glob.glob(f'{mes_dir}/*.{tipo_arquivo}')]
-        
-        if len(todos_csv) == 0:
-            return {
-                'sucesso': False,
-                'erro': 'Nenhum dado foi extraído. Verifique se os meses selecionados têm dados disponíveis.'
-            }
-        
-        # Combinar todos os arquivos
-        combinado_csv = pd.concat([pd.read_csv(f) for f in todos_csv])
-        
-        # Exportar CSV consolidado
-        arquivo_csv_final = f"resultados/gastos_vereadores_{ano}_{mes_inicio:02d}_{mes_fim:02d}.csv"
-        combinado_csv.to_csv(arquivo_csv_final, index=False, encoding='utf-8-sig')
-        
-        # Ler e limpar dados
-        df_vereadores = pd.read_csv(arquivo_csv_final)
-        df_vereadores = df_vereadores.sort_values(by='Vereador')
-        
-        # Exportar para Excel
-        arquivo_excel = f"resultados/Gastos_Vereadores_{ano}_{mes_inicio:02d}_{mes_fim:02d}.xlsx"
-        df_vereadores.to_excel(arquivo_excel, index=False, engine='openpyxl')
-        
-        fim = perf_counter()
-        tempo_execucao = fim - inicio
+        ano_atual = datetime.now().year
+        col1, col2 = st.columns(2)
         
-        # Estatísticas
-        total_registros = len(df_vereadores)
-        total_vereadores = df_vereadores['Vereador'].nunique()
+        with col1:
+            ano_inicio = st.number_input(
+                "Ano Inicial:",
+                min_value=2020,
+                max_value=ano_atual,
+                value=int(ano),
+                step=1
+            )
+            mes_inicio = st.selectbox(
+                "Mês Inicial:",
+                range(1, 13),
+                format_func=lambda x: f"{x:02d} - {MESES[x-1]}"
+            )
         
-        return {
-            'sucesso': True,
-            'arquivo_excel': arquivo_excel,
-            'arquivo_csv': arquivo_csv_final,
-            'total_registros': total_registros,
-            'total_vereadores': total_vereadores,
-            'tempo_execucao': tempo_execucao
-        }
+        with col2:
+            ano_fim = st.number_input(
+                "Ano Final:",
+                min_value=int(ano_inicio),
+                max_value=ano_atual,
+                value=int(ano_inicio),
+                step=1
+            )
+            mes_fim = st.selectbox(
+                "Mês Final:",
+                range(mes_inicio, 13) if ano_fim == ano_inicio else range(1, 13),
+                format_func=lambda x: f"{x:02d} - {MESES[x-1]}"
+            )
         
-    except Exception as e:
         return {
-            'sucesso': False,
-            'erro': str(e)
+            'ano_inicio': int(ano_inicio),
+            'mes_inicio': mes_inicio,
+            'ano_fim': int(ano_fim),
+            'mes_fim': mes_fim
         }
+    
+    def mensagem_progresso(self, ano, parametros):
+        return f"Extraindo dados de {parametros['mes_inicio']:02d}/{parametros['ano_inicio']} até {parametros['mes_fim']:02d}/{parametros['ano_fim']}..."
+    
+    def executar(self, ano, reprocessar=False, perfil=False, **parametros):
+        return extrair_gastos_periodo(
+            parametros['ano_inicio'],
+            parametros['mes_inicio'],
+            parametros['ano_fim'],
+            parametros['mes_fim'],
+            reprocessar,
+            perfil
+        )
+    
+    def metricas(self, resultado):
+        return [
+            ("Total de Registros", resultado['total_registros']),
+            ("Vereadores", resultado['total_vereadores']),
+            ("Meses", resultado['total_meses']),
+            ("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
+        ]
+
+EXTRATOR = ExtratorGastos()
@@ -0,0 +1,50 @@
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+# Atributos padrão de logging.LogRecord; o que não estiver aqui veio de extra={...}
+_ATRIBUTOS_PADRAO = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+
+class FormatadorJSON(logging.Formatter):
+    """Formata cada registro como uma linha JSON, incluindo os campos passados em extra"""
+
+    def format(self, record):
+        evento = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensagem": record.getMessage(),
+        }
+        for chave, valor in vars(record).items():
+            if chave not in _ATRIBUTOS_PADRAO and not chave.startswith("_"):
+                evento[chave] = valor
+        if record.exc_info:
+            evento["excecao"] = self.formatException(record.exc_info)
+        return json.dumps(evento, ensure_ascii=False, default=str)
+
+
+def _configurar_raiz():
+    raiz = logging.getLogger("extratores")
+    if not any(isinstance(handler.formatter, FormatadorJSON) for handler in raiz.handlers):
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(FormatadorJSON())
+        raiz.addHandler(handler)
+        raiz.setLevel(os.environ.get("MONITORAMENTO_LOG_NIVEL", "INFO").upper())
+        raiz.propagate = False
+    return raiz
+
+
+def obter_logger(nome):
+    """
+    Logger estruturado (uma linha JSON por evento em stderr)
+
+    Campos adicionais vão em extra, por exemplo:
+    log.info("Mês processado", extra={"ano": 2024, "mes": 3})
+
+    O nível é definido pela variável de ambiente MONITORAMENTO_LOG_NIVEL (padrão INFO).
+    """
+    _configurar_raiz()
+    return logging.getLogger(nome if nome.startswith("extratores") else f"extratores.{nome}")
@@ -0,0 +1,241 @@
+from array import array
+
+VOTO_PENDENTE = "Aguarda votação pela comissão"
+
+
+class MatrizVotos:
+    """
+    Matriz esparsa de votos parlamentar × projeto × comissão
+
+    Parlamentares, projetos, comissões e votos são codificados em inteiros
+    (dicionários valor -> código) e cada voto vira uma linha de quatro
+    colunas inteiras. Ao consolidar, as linhas são deduplicadas e ordenadas
+    por parlamentar e (projeto, comissão), com um vetor de deslocamentos por
+    parlamentar, de modo que as consultas usam apenas operações vetorizadas
+    do numpy sobre inteiros em vez de group-bys de strings.
+    """
+
+    def __init__(self):
+        self.parlamentares = {}
+        self.projetos = {}
+        self.comissoes = {}
+        self.votos = {}
+        self._parlamentar = array("i")
+        self._projeto = array("i")
+        self._comissao = array("i")
+        self._voto = array("i")
+        self._colunas = None
+
+    @staticmethod
+    def _codigo(dicionario, valor):
+        codigo = dicionario.get(valor)
+        if codigo is None:
+            codigo = dicionario[valor] = len(dicionario)
+        return codigo
+
+    def adicionar(self, comissao, parlamentar, projeto, voto):
+        """Acrescenta um voto à matriz"""
+        self._parlamentar.append(self._codigo(self.parlamentares, parlamentar))
+        self._projeto.append(self._codigo(self.projetos, projeto))
+        self._comissao.append(self._codigo(self.comissoes, comissao))
+        self._voto.append(self._codigo(self.votos, voto))
+        self._colunas = None
+
+    def mesclar(self, outra):
+        """Acrescenta os votos de outra matriz (por exemplo, de outro ano), recodificando seus dicionários"""
+        import numpy as np
+
+        colunas = outra.colunas()
+        for dicionario, dicionario_outra, coluna, destino in (
+            (self.parlamentares, outra.parlamentares, "parlamentar", self._parlamentar),
+            (self.projetos, outra.projetos, "projeto", self._projeto),
+            (self.comissoes, outra.comissoes, "comissao", self._comissao),
+            (self.votos, outra.votos, "voto", self._voto),
+        ):
+            recodificacao = np.array([self._codigo(dicionario, valor) for valor in dicionario_outra], dtype=np.int32)
+            if len(colunas[coluna]):
+                destino.frombytes(recodificacao[colunas[coluna]].tobytes())
+        self._colunas = None
+        return self
+
+    def __len__(self):
+        return len(self.colunas()["parlamentar"])
+
+    def colunas(self):
+        """
+        Colunas consolidadas da matriz
+
+        Returns:
+            dict: Vetores numpy parlamentar, projeto, comissao, voto, chave
+            (projeto * n_comissoes + comissao) e deslocamentos por parlamentar
+        """
+        if self._colunas is not None:
+            return self._colunas
+
+        import numpy as np
+
+        parlamentar = np.frombuffer(self._parlamentar, dtype=np.int32).astype(np.int64)
+        projeto = np.frombuffer(self._projeto, dtype=np.int32).astype(np.int64)
+        comissao = np.frombuffer(self._comissao, dtype=np.int32).astype(np.int64)
+        voto = np.frombuffer(self._voto, dtype=np.int32)
+
+        n_comissoes = max(len(self.comissoes), 1)
+        n_celulas = max(len(self.projetos), 1) * n_comissoes
+        chave = projeto * n_comissoes + comissao
+
+        # Um voto por (parlamentar, projeto, comissão): vale o último registrado
+        celula = parlamentar * n_celulas + chave
+        ordem = np.lexsort((np.arange(len(celula))[::-1], celula))
+        celula_ordenada = celula[ordem]
+        primeiro = np.ones(len(ordem), dtype=bool)
+        primeiro[1:] = celula_ordenada[1:] != celula_ordenada[:-1]
+        ordem = ordem[primeiro]
+
+        parlamentar = parlamentar[ordem].astype(np.int32)
+        self._colunas = {
+            "parlamentar": parlamentar,
+            "projeto": projeto[ordem].astype(np.int32),
+            "comissao": comissao[ordem].astype(np.int32),
+            "voto": voto[ordem],
+            "chave": chave[ordem],
+            "deslocamentos": np.searchsorted(parlamentar, np.arange(len(self.parlamentares) + 1)),
+        }
+        return self._colunas
+
+    def _votos_de(self, parlamentar, ignorar):
+        """Chaves (projeto, comissão) e votos de um parlamentar, sem os votos ignorados (vazios se desconhecido)"""
+        import numpy as np
+
+        colunas = self.colunas()
+        codigo = self.parlamentares.get(parlamentar)
+        if codigo is None:
+            return colunas["chave"][:0], colunas["voto"][:0]
+        inicio, fim = colunas["deslocamentos"][codigo], colunas["deslocamentos"][codigo + 1]
+        chaves = colunas["chave"][inicio:fim]
+        votos = colunas["voto"][inicio:fim]
+        ignorados = [self.votos[v] for v in ignorar if v in self.votos]
+        if ignorados:
+            validos = ~np.isin(votos, ignorados)
+            chaves, votos = chaves[validos], votos[validos]
+        return chaves, votos
+
+    def taxa_concordancia(self, parlamentar_a, parlamentar_b, ignorar=(VOTO_PENDENTE,)):
+        """
+        Taxa de concordância entre dois parlamentares
+
+        Considera os pares (projeto, comissão) em que ambos votaram. Um
+        parlamentar desconhecido não tem votos em comum com ninguém.
+
+        Returns:
+            tuple: (taxa entre 0 e 1 ou None se não houver votos em comum, votos em comum)
+        """
+        import numpy as np
+
+        chaves_a, votos_a = self._votos_de(parlamentar_a, ignorar)
+        chaves_b, votos_b = self._votos_de(parlamentar_b, ignorar)
+        _, indices_a, indices_b = np.intersect1d(chaves_a, chaves_b, assume_unique=True, return_indices=True)
+        em_comum = len(indices_a)
+        if em_comum == 0:
+            return None, 0
+        return float(np.mean(votos_a[indices_a] == votos_b[indices_b])), em_comum
+
+    def concordancia_com(self, parlamentar, ignorar=(VOTO_PENDENTE,)):
+        """
+        Taxa de concordância de um parlamentar com todos os demais
+
+        Returns:
+            dict: {parlamentar: (taxa, votos em comum)} para quem tem votos em comum
+            (vazio se o parlamentar for desconhecido)
+        """
+        import numpy as np
+
+        colunas = self.colunas()
+        chaves_ref, votos_ref = self._votos_de(parlamentar, ignorar)
+        if len(chaves_ref) == 0:
+            return {}
+
+        posicoes = np.searchsorted(chaves_ref, colunas["chave"])
+        posicoes_validas = np.minimum(posicoes, len(chaves_ref) - 1)
+        em_comum = chaves_ref[posicoes_validas] == colunas["chave"]
+        ignorados = [self.votos[v] for v in ignorar if v in self.votos]
+        if ignorados:
+            em_comum &= ~np.isin(colunas["voto"], ignorados)
+        em_comum &= colunas["parlamentar"] != self.parlamentares[parlamentar]
+
+        n_parlamentares = len(self.parlamentares)
+        outros = colunas["parlamentar"][em_comum]
+        iguais = colunas["voto"][em_comum] == votos_ref[posicoes_validas[em_comum]]
+        totais = np.bincount(outros, minlength=n_parlamentares)
+        concordancias = np.bincount(outros, weights=iguais, minlength=n_parlamentares)
+
+        nomes = list(self.parlamentares)
+        return {
+            nomes[codigo]: (float(concordancias[codigo] / totais[codigo]), int(totais[codigo]))
+            for codigo in np.nonzero(totais)[0]
+        }
+
+    def apuracao_por_comissao(self, projeto=None):
+        """
+        Contagem de votos por comissão, opcionalmente restrita a um projeto
+
+        Returns:
+            dict: {comissão: {voto: quantidade}} (vazio se o projeto for desconhecido)
+        """
+        import numpy as np
+
+        colunas = self.colunas()
+        comissao, voto = colunas["comissao"], colunas["voto"]
+        if projeto is not None:
+            if projeto not in self.projetos:
+                return {}
+            filtro = colunas["projeto"] == self.projetos[projeto]
+            comissao, voto = comissao[filtro], voto[filtro]
+
+        n_votos = max(len(self.votos), 1)
+        contagens = np.bincount(
+            comissao.astype(np.int64) * n_votos + voto,
+            minlength=len(self.comissoes) * n_votos
+        ).reshape(len(self.comissoes), n_votos)
+
+        nomes_comissoes = list(self.comissoes)
+        nomes_votos = list(self.votos)
+        apuracao = {}
+        for codigo_comissao, codigo_voto in zip(*np.nonzero(contagens)):
+            apuracao.setdefault(nomes_comissoes[codigo_comissao], {})[nomes_votos[codigo_voto]] = int(contagens[codigo_comissao, codigo_voto])
+        return apuracao
+
+    def salvar(self, caminho_arquivo):
+        """Grava a matriz consolidada e seus dicionários em um arquivo .npz comprimido"""
+        import numpy as np
+
+        colunas = self.colunas()
+        with open(caminho_arquivo, "wb") as f:
+            np.savez_compressed(
+                f,
+                parlamentar=colunas["parlamentar"],
+                projeto=colunas["projeto"],
+                comissao=colunas["comissao"],
+                voto=colunas["voto"],
+                nomes_parlamentares=np.array(list(self.parlamentares), dtype=str),
+                nomes_projetos=np.array(list(self.projetos), dtype=str),
+                nomes_comissoes=np.array(list(self.comissoes), dtype=str),
+                nomes_votos=np.array(list(self.votos), dtype=str),
+            )
+        return caminho_arquivo
+
+    @classmethod
+    def carregar(cls, caminho_arquivo):
+        """Lê uma matriz gravada por salvar()"""
+        import numpy as np
+
+        matriz = cls()
+        with np.load(caminho_arquivo) as dados:
+            matriz.parlamentares = {nome: codigo for codigo, nome in enumerate(dados["nomes_parlamentares"].tolist())}
+            matriz.projetos = {nome: codigo for codigo, nome in enumerate(dados["nomes_projetos"].tolist())}
+            matriz.comissoes = {nome: codigo for codigo, nome in enumerate(dados["nomes_comissoes"].tolist())}
+            matriz.votos = {nome: codigo for codigo, nome in enumerate(dados["nomes_votos"].tolist())}
+            matriz._parlamentar = array("i", dados["parlamentar"].astype(np.int32).tobytes())
+            matriz._projeto = array("i", dados["projeto"].astype(np.int32).tobytes())
+            matriz._comissao = array("i", dados["comissao"].astype(np.int32).tobytes())
+            matriz._voto = array("i", dados["voto"].astype(np.int32).tobytes())
+        return matriz
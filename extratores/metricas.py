@@ -0,0 +1,189 @@
+import bisect
+import contextvars
+import os
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from urllib.parse import urlsplit
+from extratores.log import obter_logger
+
+log = obter_logger(__name__)
+
+ARQUIVO_METRICAS = "resultados/metricas.prom"
+
+BALDES_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# Extração em andamento na thread/contexto atual (Extrator.nome), usada como rótulo "extrator"
+extrator_atual = contextvars.ContextVar("extrator_atual", default="-")
+
+_trava = threading.Lock()
+_contadores = {}
+_histogramas = {}
+_servidor = None
+
+_DESCRICOES = {
+    "extracoes_total": "Extrações concluídas (inclusive as atendidas por uma execução compartilhada), por extrator e resultado",
+    "extracao_segundos": "Duração das extrações",
+    "execucoes_compartilhadas_total": "Chamadas atendidas por uma extração idêntica já em andamento",
+    "requisicoes_total": "Requisições HTTP aos serviços de origem, por endpoint e status",
+    "requisicao_segundos": "Latência das requisições HTTP aos serviços de origem",
+    "arquivo_bruto_total": "Consultas ao arquivo bruto no modo reprocessar, por resultado (acerto/falta)",
+    "etapa_segundos": "Duração das etapas (busca, parse, escrita, planilha) por extrator",
+    "app_extracoes_solicitadas_total": "Extrações solicitadas pela interface, por extrator",
+    "app_erros_total": "Erros inesperados exibidos pela interface, por extrator",
+}
+
+
+def rotulo_endpoint(url):
+    """Rótulo de baixa cardinalidade para uma URL (números do caminho viram {n}, exceto os colados a letras)"""
+    partes = urlsplit(url)
+    return f"{partes.netloc}{re.sub(r'(?<![A-Za-z])[0-9]+', '{n}', partes.path)}"
+
+
+def _chave(nome, rotulos):
+    return nome, tuple(sorted((k, str(v)) for k, v in rotulos.items()))
+
+
+def contar(nome, valor=1, **rotulos):
+    """Incrementa um contador"""
+    chave = _chave(nome, rotulos)
+    with _trava:
+        _contadores[chave] = _contadores.get(chave, 0) + valor
+
+
+def observar(nome, valor, **rotulos):
+    """Registra uma observação (em segundos) em um histograma"""
+    chave = _chave(nome, rotulos)
+    indice = bisect.bisect_left(BALDES_SEGUNDOS, valor)
+    with _trava:
+        histograma = _histogramas.get(chave)
+        if histograma is None:
+            histograma = _histogramas[chave] = {"baldes": [0] * (len(BALDES_SEGUNDOS) + 1), "soma": 0.0, "contagem": 0}
+        histograma["baldes"][indice] += 1
+        histograma["soma"] += valor
+        histograma["contagem"] += 1
+
+
+def medir_extracao(extrator, funcao, *args, **kwargs):
+    """
+    Executa uma extração com extrator_atual=extrator e registra sua duração e resultado
+
+    Atualiza extracoes_total e extracao_segundos e regrava ARQUIVO_METRICAS ao final.
+
+    Returns:
+        O retorno de funcao
+    """
+    contexto = extrator_atual.set(extrator)
+    inicio = perf_counter()
+    situacao = "erro"
+    try:
+        resultado = funcao(*args, **kwargs)
+        if not isinstance(resultado, dict) or resultado.get('sucesso', True):
+            situacao = "sucesso"
+        return resultado
+    finally:
+        duracao = perf_counter() - inicio
+        extrator_atual.reset(contexto)
+        observar("extracao_segundos", duracao, extrator=extrator)
+        contar("extracoes_total", extrator=extrator, resultado=situacao)
+        log.info("Extração finalizada", extra={"extrator": extrator, "resultado": situacao, "duracao_s": round(duracao, 3)})
+        try:
+            gravar_arquivo()
+        except OSError as e:
+            log.warning("Não foi possível gravar o arquivo de métricas", extra={"erro": str(e)})
+
+
+@contextmanager
+def medir(etapa, **rotulos):
+    """Mede a duração de uma etapa da extração atual em etapa_segundos"""
+    inicio = perf_counter()
+    try:
+        yield
+    finally:
+        observar("etapa_segundos", perf_counter() - inicio, extrator=extrator_atual.get(), etapa=etapa, **rotulos)
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatar_rotulos(rotulos, extra=()):
+    itens = list(rotulos) + list(extra)
+    if not itens:
+        return ""
+    return "{" + ",".join(f'{k}="{_escapar(v)}"' for k, v in itens) + "}"
+
+
+def exportar_texto():
+    """Exporta todas as métricas no formato texto do Prometheus"""
+    with _trava:
+        contadores = dict(_contadores)
+        histogramas = {chave: {"baldes": list(h["baldes"]), "soma": h["soma"], "contagem": h["contagem"]} for chave, h in _histogramas.items()}
+
+    linhas = []
+    for nome in sorted({nome for nome, _ in contadores}):
+        linhas.append(f"# HELP {nome} {_DESCRICOES.get(nome, nome)}")
+        linhas.append(f"# TYPE {nome} counter")
+        for (nome_metrica, rotulos), valor in sorted(contadores.items()):
+            if nome_metrica == nome:
+                linhas.append(f"{nome}{_formatar_rotulos(rotulos)} {valor}")
+
+    for nome in sorted({nome for nome, _ in histogramas}):
+        linhas.append(f"# HELP {nome} {_DESCRICOES.get(nome, nome)}")
+        linhas.append(f"# TYPE {nome} histogram")
+        for (nome_metrica, rotulos), histograma in sorted(histogramas.items()):
+            if nome_metrica != nome:
+                continue
+            acumulado = 0
+            for limite, quantidade in zip(list(BALDES_SEGUNDOS) + ["+Inf"], histograma["baldes"]):
+                acumulado += quantidade
+                linhas.append(f"{nome}_bucket{_formatar_rotulos(rotulos, [('le', limite)])} {acumulado}")
+            linhas.append(f"{nome}_sum{_formatar_rotulos(rotulos)} {histograma['soma']}")
+            linhas.append(f"{nome}_count{_formatar_rotulos(rotulos)} {histograma['contagem']}")
+
+    return "\n".join(linhas) + "\n"
+
+
+def gravar_arquivo(caminho_arquivo=ARQUIVO_METRICAS):
+    """Grava as métricas em arquivo (substituição atômica), para coleta via node_exporter textfile ou similar"""
+    diretorio = os.path.dirname(caminho_arquivo)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    caminho_temporario = f"{caminho_arquivo}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(caminho_temporario, "w", encoding="utf-8") as f:
+        f.write(exportar_texto())
+    os.replace(caminho_temporario, caminho_arquivo)
+    return caminho_arquivo
+
+
+class _ManipuladorMetricas(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        corpo = exportar_texto().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+def iniciar_servidor(porta, endereco="127.0.0.1"):
+    """
+    Inicia (uma única vez por processo) o endpoint HTTP /metrics em uma thread daemon
+
+    Returns:
+        int: Porta em que o servidor está escutando
+    """
+    global _servidor
+    with _trava:
+        if _servidor is None:
+            _servidor = ThreadingHTTPServer((endereco, int(porta)), _ManipuladorMetricas)
+            threading.Thread(target=_servidor.serve_forever, name="servidor-metricas", daemon=True).start()
+        return _servidor.server_address[1]
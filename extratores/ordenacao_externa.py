@@ -0,0 +1,66 @@
+import csv
+import heapq
+import os
+import sys
+import tempfile
+
+
+class OrdenadorExterno:
+    """
+    Ordenação externa (com despejo em disco) de linhas sob um orçamento de memória
+
+    As linhas ficam em memória até o tamanho estimado ultrapassar o orçamento;
+    então o bloco é ordenado e gravado como um arquivo CSV temporário. Ao final,
+    ordenadas() intercala os blocos com heapq.merge, lendo cada um
+    sequencialmente, de modo que a memória usada não depende do total de linhas.
+    """
+
+    def __init__(self, chave, diretorio, orcamento_bytes=64 * 1024 * 1024):
+        self.chave = chave
+        self.diretorio = diretorio
+        self.orcamento_bytes = orcamento_bytes
+        self.total_linhas = 0
+        self._buffer = []
+        self._tamanho_buffer = 0
+        self._blocos = []
+
+    @staticmethod
+    def _tamanho(linha):
+        return sys.getsizeof(linha) + sum(sys.getsizeof(campo) for campo in linha)
+
+    def adicionar(self, linha):
+        self._buffer.append(linha)
+        self._tamanho_buffer += self._tamanho(linha)
+        self.total_linhas += 1
+        if self._tamanho_buffer >= self.orcamento_bytes:
+            self._despejar()
+
+    def _despejar(self):
+        """Ordena o bloco em memória e o grava em disco"""
+        if not self._buffer:
+            return
+        self._buffer.sort(key=self.chave)
+        descritor, caminho = tempfile.mkstemp(prefix="bloco-", suffix=".csv", dir=self.diretorio)
+        with os.fdopen(descritor, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(self._buffer)
+        self._blocos.append(caminho)
+        self._buffer = []
+        self._tamanho_buffer = 0
+
+    def _ler_bloco(self, caminho):
+        with open(caminho, newline="", encoding="utf-8") as f:
+            for linha in csv.reader(f):
+                yield linha
+        os.remove(caminho)
+
+    def ordenadas(self):
+        """Itera sobre todas as linhas adicionadas, em ordem"""
+        if not self._blocos:
+            self._buffer.sort(key=self.chave)
+            yield from self._buffer
+            self._buffer = []
+            return
+
+        self._despejar()
+        yield from heapq.merge(*[self._ler_bloco(caminho) for caminho in self._blocos], key=self.chave)
+        self._blocos = []
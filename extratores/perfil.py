@@ -0,0 +1,141 @@
+import functools
+import inspect
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime
+from time import perf_counter
+from extratores.execucao import DIRETORIO_RESULTADOS
+
+DIRETORIO_PERFIS = f"{DIRETORIO_RESULTADOS}/perfis"
+
+
+class AmostradorPerfil:
+    """
+    Perfilador por amostragem das pilhas de uma thread
+
+    Uma thread auxiliar lê a pilha da thread alvo a cada intervalo e conta
+    quantas vezes cada pilha foi observada. O resultado pode ser gravado no
+    formato "pilhas dobradas" (compatível com flamegraph.pl, speedscope e
+    inferno) e resumido em uma tabela com as funções mais custosas.
+
+    Apenas a thread alvo é amostrada. Trabalho feito em outras threads (por
+    exemplo, as buscas antecipadas de meses em gastos_vereadores) aparece
+    só como espera, em Future.result, na pilha da thread alvo.
+    """
+
+    def __init__(self, intervalo=0.005, thread_id=None):
+        self.intervalo = intervalo
+        self.thread_id = thread_id
+        self.pilhas = Counter()
+        self.total_amostras = 0
+        self.duracao = 0.0
+        self._inicio = None
+        self._parar = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.thread_id is None:
+            self.thread_id = threading.get_ident()
+        self._inicio = perf_counter()
+        self._thread = threading.Thread(target=self._amostrar, name="amostrador-perfil", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.duracao = perf_counter() - self._inicio
+        self._parar.set()
+        self._thread.join()
+        return False
+
+    @staticmethod
+    def _rotulo(codigo):
+        return f"{codigo.co_name} ({os.path.basename(codigo.co_filename)}:{codigo.co_firstlineno})"
+
+    def _amostrar(self):
+        while not self._parar.wait(self.intervalo):
+            frame = sys._current_frames().get(self.thread_id)
+            pilha = []
+            while frame is not None:
+                if frame.f_code is AmostradorPerfil.__exit__.__code__:
+                    # Amostra tirada durante o encerramento do próprio amostrador
+                    pilha = []
+                    break
+                pilha.append(self._rotulo(frame.f_code))
+                frame = frame.f_back
+            if pilha:
+                pilha.reverse()
+                self.pilhas[tuple(pilha)] += 1
+                self.total_amostras += 1
+
+    def salvar_pilhas(self, caminho_arquivo):
+        """Grava as pilhas no formato dobrado: "raiz;...;folha contagem" por linha"""
+        with open(caminho_arquivo, "w", encoding="utf-8") as f:
+            for pilha, contagem in self.pilhas.most_common():
+                f.write(f"{';'.join(pilha)} {contagem}\n")
+        return caminho_arquivo
+
+    def hotspots(self, n=25):
+        """
+        Funções com mais amostras
+
+        Returns:
+            list: Tuplas (função, amostras próprias, amostras totais), ordenadas pelas próprias
+        """
+        proprias = Counter()
+        totais = Counter()
+        for pilha, contagem in self.pilhas.items():
+            proprias[pilha[-1]] += contagem
+            for funcao in set(pilha):
+                totais[funcao] += contagem
+        return [(funcao, amostras, totais[funcao]) for funcao, amostras in proprias.most_common(n)]
+
+    def salvar_hotspots(self, caminho_arquivo, n=25):
+        """Grava a tabela das n funções mais custosas"""
+        total = max(self.total_amostras, 1)
+        linhas = [
+            f"Duração: {self.duracao:.2f}s",
+            f"Amostras: {self.total_amostras} (intervalo de {self.intervalo * 1000:.0f} ms; menos amostras que o esperado indicam disputa pelo GIL)",
+            "",
+            f"{'Próprio':>8} {'%':>6} {'Total':>8} {'%':>6}  Função",
+        ]
+        for funcao, proprias, totais in self.hotspots(n):
+            linhas.append(f"{proprias:>8} {100 * proprias / total:>5.1f}% {totais:>8} {100 * totais / total:>5.1f}%  {funcao}")
+        with open(caminho_arquivo, "w", encoding="utf-8") as f:
+            f.write("\n".join(linhas) + "\n")
+        return caminho_arquivo
+
+
+def com_perfil(funcao):
+    """
+    Executa a extração sob o AmostradorPerfil quando chamada com perfil=True
+
+    Os artefatos (<planilha>.perfil.folded e <planilha>.perfil.txt) são
+    gravados em uma pasta própria da execução em DIRETORIO_PERFIS, e não na
+    pasta publicada da planilha, que pode ser substituída por outra execução
+    a qualquer momento. Seus caminhos são adicionados ao dicionário
+    retornado. Com perfil=False a função é chamada diretamente, sem nenhuma
+    instrumentação.
+    """
+    assinatura = inspect.signature(funcao)
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        argumentos = assinatura.bind(*args, **kwargs)
+        if not argumentos.arguments.get("perfil", False):
+            return funcao(*args, **kwargs)
+
+        with AmostradorPerfil() as amostrador:
+            resultado = funcao(*args, **kwargs)
+
+        if resultado.get('sucesso') and resultado.get('arquivo_excel'):
+            os.makedirs(DIRETORIO_PERFIS, exist_ok=True)
+            diretorio = tempfile.mkdtemp(prefix=f"{datetime.now():%Y%m%dT%H%M%S}-", dir=DIRETORIO_PERFIS)
+            base = os.path.join(diretorio, os.path.splitext(os.path.basename(resultado['arquivo_excel']))[0])
+            resultado['arquivo_perfil'] = amostrador.salvar_pilhas(f"{base}.perfil.folded")
+            resultado['arquivo_hotspots'] = amostrador.salvar_hotspots(f"{base}.perfil.txt")
+        return resultado
+
+    return envoltorio
@@ -0,0 +1,191 @@
+import os
+from time import perf_counter
+from extratores.base import ChaveProjeto, ColetorCSV, Extrator, buscar, criar_diretorio, decodificar_json
+from extratores.comissoes_votacoes import API_COMISSOES
+from extratores.matriz_votos import VOTO_PENDENTE
+from extratores.projetos_tramitacao import API_DELIBERACOES, API_PROJETOS_ANO, escrever_planilha, indexar_ementas, processar_deliberacoes
+from extratores.perfil import com_perfil
+from extratores.execucao import DIRETORIO_RESULTADOS, area_trabalho, execucao_unica, publicar
+from extratores.log import obter_logger
+
+log = obter_logger(__name__)
+
+CABECALHO = ["Projeto", "Ementa", "Data_Apresentação", "Data_Aprovação", "Tempo_Tramitação", "Comissão", "Parlamentar", "Voto"]
+
+def buscar_json(endpoint, parametros, reprocessar=False):
+    """Consulta um endpoint JSON uma única vez; retorna None em caso de falha"""
+    try:
+        resposta = buscar(endpoint, parametros, timeout=60, reprocessar=reprocessar)
+        if resposta.status_code == 200:
+            return decodificar_json(resposta)
+        log.warning("Erro ao consultar endpoint", extra={"endpoint": endpoint, "status": resposta.status_code})
+    except Exception as e:
+        log.error("Requisição mal-sucedida ou falha de timeout", extra={"endpoint": endpoint, "erro": str(e)})
+    return None
+
+def indexar_votos(resposta_obj):
+    """Agrupa os votos de ProjetosReunioesDeComissao por ChaveProjeto (lado de construção do hash join)"""
+    votos = {}
+    for registro in resposta_obj:
+        chave = ChaveProjeto.tentar_de_registro(registro)
+        if chave is None:
+            continue
+        linhas = votos.setdefault(chave, [])
+        for encaminhamento in registro.get("encaminhamentos") or []:
+            for comissao in encaminhamento.get("comissoes") or []:
+                linhas.append([
+                    comissao["nome"],
+                    comissao["nomePolitico"],
+                    comissao.get("conclusao", VOTO_PENDENTE)
+                ])
+    return votos
+
+def juntar_tramitacao_votos(tramitacao, ementas, votos):
+    """
+    Junta tramitação, ementas e votos de comissão pela ChaveProjeto
+
+    Gera uma linha por voto; projetos sem votos aparecem uma vez com as colunas
+    de voto vazias e projetos com votos mas sem deliberação aparecem com as
+    colunas de tramitação vazias.
+
+    Args:
+        tramitacao (dict): ChaveProjeto -> dado de processar_deliberacoes
+        ementas (dict): ChaveProjeto -> ementa
+        votos (dict): ChaveProjeto -> lista de [Comissão, Parlamentar, Voto]
+
+    Returns:
+        list: Linhas no formato de CABECALHO
+    """
+    linhas = []
+    chaves = list(tramitacao) + [chave for chave in votos if chave not in tramitacao]
+    for chave in chaves:
+        dado = tramitacao.get(chave, {})
+        inicio_linha = [
+            str(chave),
+            ementas.get(chave, "Ementa não disponível"),
+            dado.get("data_apresent", ""),
+            dado.get("data_aprovacao", ""),
+            dado.get("tempo_tramitacao", "")
+        ]
+        votos_projeto = votos.get(chave) or [["", "", ""]]
+        for voto in votos_projeto:
+            linhas.append(inicio_linha + voto)
+    return linhas
+
+@execucao_unica
+@com_perfil
+def extrair_projetos_comissoes(ano, tipo_projeto, reprocessar=False, perfil=False):
+    """
+    Extrai tramitação e votos de comissão de um tipo de projeto em um único conjunto de dados
+
+    Consulta FasesDeDeliberacaoJSON, ProjetosPorAnoJSON e
+    ProjetosReunioesDeComissaoJSON uma vez cada e junta os resultados em
+    memória pela chave (tipo, número, ano).
+
+    Args:
+        ano (int): Ano para extração
+        tipo_projeto (str): Tipo de projeto (PL, PDL, etc)
+        reprocessar (bool): Reprocessa a partir do arquivo bruto, sem acesso à rede
+        perfil (bool): Grava um perfil de execução ao lado da planilha
+
+    Returns:
+        dict: Dicionário com resultado da extração
+    """
+    inicio = perf_counter()
+
+    try:
+        log.info("Iniciando extração combinada", extra={"tipo": tipo_projeto, "ano": ano})
+
+        deliberacoes = buscar_json(API_DELIBERACOES, {'ano': str(ano)}, reprocessar)
+        projetos_ano = buscar_json(API_PROJETOS_ANO, {'ano': str(ano)}, reprocessar)
+        reunioes = buscar_json(API_COMISSOES, {'ano': str(ano), 'tipo': str(tipo_projeto)}, reprocessar)
+
+        if deliberacoes is None and reunioes is None:
+            return {
+                'sucesso': False,
+                'erro': f'Não foi possível consultar as APIs para {tipo_projeto} do ano {ano}'
+            }
+
+        # Lados de construção do hash join
+        tramitacao = {}
+        for dado in processar_deliberacoes(deliberacoes or [], tipo_projeto):
+            chave = ChaveProjeto.tentar_de_registro(dado)
+            if chave is not None:
+                tramitacao[chave] = dado
+
+        ementas = indexar_ementas(projetos_ano or [])
+
+        votos = indexar_votos(reunioes or [])
+
+        linhas = juntar_tramitacao_votos(tramitacao, ementas, votos)
+
+        if len(linhas) == 0:
+            return {
+                'sucesso': False,
+                'erro': f'Nenhum dado encontrado para {tipo_projeto} do ano {ano}'
+            }
+
+        # Escrever dados na área de trabalho isolada e publicar
+        nome_dados = f"projetos-comissoes-{tipo_projeto}-{ano}"
+
+        with area_trabalho(f"projetos-comissoes-{tipo_projeto}-{ano}") as trabalho:
+            diretorio_dados = os.path.join(trabalho, nome_dados)
+            criar_diretorio(diretorio_dados)
+
+            caminho_arquivo_csv = f"{diretorio_dados}/projetos_comissoes_{tipo_projeto}_{ano}.csv"
+            caminho_arquivo_planilha = f"{diretorio_dados}/projetos_comissoes_{tipo_projeto}_{ano}.xlsx"
+
+            coletor = ColetorCSV(CABECALHO)
+            coletor.adicionar(caminho_arquivo_csv, linhas)
+            coletor.gravar()
+
+            escrever_planilha(caminho_arquivo_csv, caminho_arquivo_planilha)
+
+            publicar(diretorio_dados, f"{DIRETORIO_RESULTADOS}/{nome_dados}")
+            caminho_arquivo_planilha = f"{DIRETORIO_RESULTADOS}/{nome_dados}/{os.path.basename(caminho_arquivo_planilha)}"
+
+        fim = perf_counter()
+        tempo_execucao = fim - inicio
+
+        return {
+            'sucesso': True,
+            'arquivo_excel': caminho_arquivo_planilha,
+            'total_projetos': len(set(tramitacao) | set(votos)),
+            'total_votos': sum(len(v) for v in votos.values()),
+            'tempo_execucao': tempo_execucao
+        }
+
+    except Exception as e:
+        return {
+            'sucesso': False,
+            'erro': str(e)
+        }
+
+class ExtratorProjetosComissoes(Extrator):
+    nome = "Tramitação e Votos em Comissões"
+    titulo = " Extração Combinada de Tramitação e Votos em Comissões"
+    descricao = "Este extrator junta o tempo de tramitação, a ementa e os votos em comissões de cada projeto em uma única planilha."
+    ordem = 40
+
+    def formulario(self, st, ano):
+        tipo_projeto = st.sidebar.text_input(
+            "Tipo de Projeto:",
+            value="PL",
+            help="Ex: PL, PDL, PEC, etc."
+        )
+        return {'tipo_projeto': tipo_projeto}
+
+    def mensagem_progresso(self, ano, parametros):
+        return f"Extraindo tramitação e votos de {parametros['tipo_projeto']} do ano {ano}..."
+
+    def executar(self, ano, reprocessar=False, perfil=False, **parametros):
+        return extrair_projetos_comissoes(ano, parametros['tipo_projeto'], reprocessar, perfil)
+
+    def metricas(self, resultado):
+        return [
+            ("Total de Projetos", resultado['total_projetos']),
+            ("Total de Votos", resultado['total_votos']),
+            ("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
+        ]
+
+EXTRATOR = ExtratorProjetosComissoes()
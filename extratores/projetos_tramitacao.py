@@ -1,153 +1,152 @@
-import requests
-import json
 from datetime import datetime
 import re
-import glob
-import csv
 import os
-import pandas as pd
 from time import perf_counter
+from extratores.base import ChaveProjeto, ColetorCSV, Extrator, buscar, criar_diretorio, decodificar_json
+from extratores.perfil import com_perfil
+from extratores.execucao import DIRETORIO_RESULTADOS, area_trabalho, execucao_unica, publicar
+from extratores.log import obter_logger
+from extratores.metricas import medir
 
-def criar_diretorio(nome_diretorio):
-    """Cria diretório se não existir"""
-    try:
-        os.makedirs(nome_diretorio, exist_ok=True)
-    except Exception as e:
-        print(f"Erro ao criar diretório: {e}")
+log = obter_logger(__name__)
 
-def primeira_fase_extracao(parametros, tipo_proj):
-    """Primeira fase: extrai dados básicos dos projetos"""
-    DATAS_FIX_2023 = {'PL-192': '14/04/2023', 'PL-578': '29/09/2023'}
-    DATAS_FIX_2022 = {'PL-277': '14/04/2022', 'PL-579': '30/09/2022', 'PL-280': '14/04/2022'}
-    
-    API_DELIBERACOES = 'https://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/FasesDeDeliberacaoJSON'
+API_DELIBERACOES = 'https://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/FasesDeDeliberacaoJSON'
+API_PROJETOS_ANO = 'http://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/ProjetosPorAnoJSON'
+
+DATAS_FIX_2023 = {'PL-192': '14/04/2023', 'PL-578': '29/09/2023'}
+DATAS_FIX_2022 = {'PL-277': '14/04/2022', 'PL-579': '30/09/2022', 'PL-280': '14/04/2022'}
+
+def processar_deliberacoes(resposta_obj, tipo_proj):
+    """Extrai datas de apresentação e aprovação e o tempo de tramitação dos registros de FasesDeDeliberacao"""
     dados = []
+    for registro in resposta_obj:
+        if ChaveProjeto.tentar_de_registro(registro) is None:
+            continue
+        if registro['tipo'] != tipo_proj:
+            continue
+        
+        infos_projeto = f"{registro['tipo']} {registro['numero']}/{registro['ano']}"
+        data_apresent_extraida = registro.get('leitura', 'Data não encontrada')
+        
+        try:
+            data_apresent = re.search(r"\d{4}-\d{2}-\d{2}", data_apresent_extraida).group()
+        except:
+            data_apresent = ""
+        
+        data_apresent_final = ""
+        frase_aprovacao = ""
+        formato_data = "%d/%m/%Y"
+        casos_especiais = False
+        
+        if data_apresent == "":
+            if registro['ano'] == 2022:
+                if DATAS_FIX_2022.get(f"{registro['tipo']}-{registro['numero']}") is not None:
+                    data_apresent_final = DATAS_FIX_2022.get(f"{registro['tipo']}-{registro['numero']}")
+                    casos_especiais = True
+            elif registro['ano'] == 2023:
+                if DATAS_FIX_2023.get(f"{registro['tipo']}-{registro['numero']}") is not None:
+                    data_apresent_final = DATAS_FIX_2023.get(f"{registro['tipo']}-{registro['numero']}")
+                    casos_especiais = True
+        
+        if not casos_especiais:
+            try:
+                data_temp = data_apresent.split("-")
+                data_apresent_final = f"{data_temp[2]}/{data_temp[1]}/{data_temp[0]}"
+            except:
+                data_apresent_final = data_apresent_extraida
+        
+        for deliberacao in registro.get('deliberacoes') or []:
+            frase_aprovacao = deliberacao.get('resultado') or ""
+        
+        try:
+            data_aprovacao = re.search(r'\b\d{2}/\d{2}/\d{4}\b', frase_aprovacao).group()
+        except:
+            data_aprovacao = "Data não encontrada"
+        
+        try:
+            data_apresent_obj = datetime.strptime(data_apresent_final, formato_data)
+            data_aprovacao_obj = datetime.strptime(data_aprovacao, formato_data)
+            tempo_tramitacao = data_aprovacao_obj - data_apresent_obj
+            tempo_tramitacao_dias = str(tempo_tramitacao.days)
+        except:
+            tempo_tramitacao_dias = "Não foi possível de ser calculado"
+        
+        dados.append({
+            "tipo": registro['tipo'],
+            "numero": registro['numero'],
+            "ano": registro['ano'],
+            "info_projeto": infos_projeto,
+            "data_apresent": data_apresent_final,
+            "data_aprovacao": data_aprovacao,
+            "tempo_tramitacao": tempo_tramitacao_dias
+        })
     
+    return dados
+
+def indexar_ementas(resposta_obj):
+    """Indexa as ementas de ProjetosPorAno por ChaveProjeto, mantendo a primeira ocorrência"""
+    ementas = {}
+    for registro in resposta_obj:
+        chave = ChaveProjeto.tentar_de_registro(registro)
+        if chave is not None:
+            ementas.setdefault(chave, registro.get('ementa', "Ementa não disponível"))
+    return ementas
+
+def primeira_fase_extracao(parametros, tipo_proj, reprocessar=False):
+    """Primeira fase: extrai dados básicos dos projetos"""
     try:
-        resposta = requests.get(API_DELIBERACOES, params=parametros, timeout=60)
+        resposta = buscar(API_DELIBERACOES, parametros, timeout=60, reprocessar=reprocessar)
         if resposta.status_code == 200:
-            resposta_obj = json.loads(resposta.content)
-            for registro in resposta_obj:
-                if registro['tipo'] != tipo_proj:
-                    pass
-                else:
-                    infos_projeto = f"{registro['tipo']} {registro['numero']}/{registro['ano']}"
-                    data_apresent_extraida = registro.get('leitura', 'Data não encontrada')
-                    
-                    try:
-                        data_apresent = re.search(r"\d{4}-\d{2}-\d{2}", data_apresent_extraida).group()
-                    except:
-                        data_apresent = ""
-                    
-                    data_apresent_final = ""
-                    frase_aprovacao = ""
-                    formato_data = "%d/%m/%Y"
-                    casos_especiais = False
-                    
-                    if data_apresent == "":
-                        if registro['ano'] == 2022:
-                            if DATAS_FIX_2022.get(f"{registro['tipo']}-{registro['numero']}") is not None:
-                                data_apresent_final = DATAS_FIX_2022.get(f"{registro['tipo']}-{registro['numero']}")
-                                casos_especiais = True
-                        elif registro['ano'] == 2023:
-                            if DATAS_FIX_2023.get(f"{registro['tipo']}-{registro['numero']}") is not None:
-                                data_apresent_final = DATAS_FIX_2023.get(f"{registro['tipo']}-{registro['numero']}")
-                                casos_especiais = True
-                    
-                    if not casos_especiais:
-                        try:
-                            data_temp = data_apresent.split("-")
-                            data_apresent_final = f"{data_temp[2]}/{data_temp[1]}/{data_temp[0]}"
-                        except:
-                            data_apresent_final = data_apresent_extraida
-                    
-                    for deliberacao in registro['deliberacoes']:
-                        frase_aprovacao = deliberacao['resultado']
-                    
-                    try:
-                        data_aprovacao = re.search(r'\b\d{2}/\d{2}/\d{4}\b', frase_aprovacao).group()
-                    except:
-                        data_aprovacao = "Data não encontrada"
-                    
-                    try:
-                        data_apresent_obj = datetime.strptime(data_apresent_final, formato_data)
-                        data_aprovacao_obj = datetime.strptime(data_aprovacao, formato_data)
-                        tempo_tramitacao = data_aprovacao_obj - data_apresent_obj
-                        tempo_tramitacao_dias = str(tempo_tramitacao.days)
-                    except:
-                        tempo_tramitacao_dias = "Não foi possível de ser calculado"
-                    
-                    dados.append({
-                        "numero": registro['numero'],
-                        "info_projeto": infos_projeto,
-                        "data_apresent": data_apresent_final,
-                        "data_aprovacao": data_aprovacao,
-                        "tempo_tramitacao": tempo_tramitacao_dias
-                    })
-            
-            print("Dados extraídos com sucesso da API FasesDeDeliberação!")
+            dados = processar_deliberacoes(decodificar_json(resposta), tipo_proj)
+            log.info("Dados extraídos com sucesso da API FasesDeDeliberação", extra={"tipo": tipo_proj, "total": len(dados)})
             return dados
         else:
-            print(f"Requisição não foi OK. Status code: {resposta.status_code}")
+            log.warning("Requisição à API FasesDeDeliberação não foi OK", extra={"tipo": tipo_proj, "status": resposta.status_code})
             return None
     except Exception as e:
-        print(f"Requisição mal-sucedida ou falha de timeout na API FasesDeDeliberação: {e}")
+        log.error("Requisição mal-sucedida ou falha de timeout na API FasesDeDeliberação", extra={"tipo": tipo_proj, "erro": str(e)})
         return None
 
-def segunda_fase_extracao(parametros, dados, tipo_proj):
+def segunda_fase_extracao(parametros, dados, tipo_proj, reprocessar=False):
     """Segunda fase: adiciona ementas aos projetos"""
-    API_PROJETOS_ANO = 'http://splegisws.saopaulo.sp.leg.br/ws/ws2.asmx/ProjetosPorAnoJSON'
-    
     try:
-        resposta = requests.get(API_PROJETOS_ANO, params=parametros, timeout=60)
+        resposta = buscar(API_PROJETOS_ANO, parametros, timeout=60, reprocessar=reprocessar)
         if resposta.status_code == 200:
-            resposta_obj = json.loads(resposta.content)
+            ementas = indexar_ementas(decodificar_json(resposta))
             for dado in dados:
-                for registro in resposta_obj:
-                    if f"{tipo_proj}-{dado['numero']}" == f"{registro['tipo']}-{registro['numero']}":
-                        dado["ementa"] = registro['ementa']
-                        break
-            print("Dados extraídos com sucesso da API ProjetosAno!")
+                ementa = ementas.get(ChaveProjeto.tentar_de_registro(dado))
+                if ementa is not None:
+                    dado["ementa"] = ementa
+            log.info("Dados extraídos com sucesso da API ProjetosAno", extra={"tipo": tipo_proj})
             return dados
         else:
-            print(f"Erro na segunda fase. Status: {resposta.status_code}")
+            log.warning("Erro na segunda fase", extra={"tipo": tipo_proj, "status": resposta.status_code})
             return dados
     except Exception as e:
-        print(f"Requisição mal-sucedida ou falha de timeout na API ProjetosAno: {e}")
+        log.error("Requisição mal-sucedida ou falha de timeout na API ProjetosAno", extra={"tipo": tipo_proj, "erro": str(e)})
         return dados
 
-def escrever_arquivo_csv(caminho_arquivo, info, cabecalho):
-    """Escreve dados no arquivo CSV"""
-    if len(glob.glob(caminho_arquivo)) > 0:
-        try:
-            with open(caminho_arquivo, "a", newline="") as f:
-                writer = csv.writer(f)
-                writer.writerows(info)
-        except Exception as e:
-            print(f"Erro ao escrever no arquivo existente: {e}")
-    else:
-        try:
-            with open(caminho_arquivo, "w", newline="") as f:
-                info.insert(0, cabecalho)
-                writer = csv.writer(f)
-                writer.writerows(info)
-        except Exception as e:
-            print(f"Erro ao criar novo arquivo: {e}")
-
 def escrever_planilha(caminho_arquivo_csv, caminho_planilha):
     """Converte CSV para Excel"""
-    df_projetos_tramitacao = pd.read_csv(caminho_arquivo_csv)
-    with pd.ExcelWriter(caminho_planilha, mode="w", engine="openpyxl") as writer:
-        df_projetos_tramitacao.to_excel(writer, sheet_name="Folha1", index=False)
-    print("Planilha gerada com sucesso!")
+    import pandas as pd
+    
+    with medir("planilha"):
+        df_projetos_tramitacao = pd.read_csv(caminho_arquivo_csv)
+        with pd.ExcelWriter(caminho_planilha, mode="w", engine="openpyxl") as writer:
+            df_projetos_tramitacao.to_excel(writer, sheet_name="Folha1", index=False)
+    log.info("Planilha gerada com sucesso", extra={"arquivo": caminho_planilha})
 
-def extrair_projetos_tramitacao(ano, tipo_projeto):
+@execucao_unica
+@com_perfil
+def extrair_projetos_tramitacao(ano, tipo_projeto, reprocessar=False, perfil=False):
     """
     Extrai informações sobre projetos em tramitação
     
     Args:
         ano (int): Ano para extração
         tipo_projeto (str): Tipo de projeto (PL, PDL, etc)
+        reprocessar (bool): Reprocessa a partir do arquivo bruto, sem acesso à rede
+        perfil (bool): Grava um perfil de execução ao lado da planilha
     
     Returns:
         dict: Dicionário com resultado da extração
@@ -159,13 +158,10 @@ def extrair_projetos_tramitacao(ano, tipo_projeto):
         
         parametros = {'ano': str(ano)}
         
-        diretorio_dados = f"resultados/dados-{tipo_projeto}-{ano}"
-        criar_diretorio(diretorio_dados)
-        
-        print(f"Iniciando extração para {tipo_projeto} do ano {ano}...")
+        log.info("Iniciando extração de tramitação", extra={"tipo": tipo_projeto, "ano": ano})
         
         # Primeira fase
-        dados = primeira_fase_extracao(parametros, tipo_projeto)
+        dados = primeira_fase_extracao(parametros, tipo_projeto, reprocessar)
         
         if dados is None or len(dados) == 0:
             return {
@@ -174,7 +170,7 @@ def extrair_projetos_tramitacao(ano, tipo_projeto):
             }
         
         # Segunda fase
-        dados = segunda_fase_extracao(parametros, dados, tipo_projeto)
+        dados = segunda_fase_extracao(parametros, dados, tipo_projeto, reprocessar)
         
         if dados is None:
             return {
@@ -182,22 +178,32 @@ def extrair_projetos_tramitacao(ano, tipo_projeto):
                 'erro': 'Erro na segunda fase de extração'
             }
         
-        # Escrever dados
-        caminho_arquivo_csv = f"{diretorio_dados}/projetos_tramitacao_{tipo_projeto}_{ano}.csv"
-        caminho_arquivo_planilha = f"{diretorio_dados}/projetos_tramitacao_{tipo_projeto}_{ano}.xlsx"
+        # Escrever dados na área de trabalho isolada e publicar
+        # (pasta própria: dados-{tipo}-{ano} pertence ao extrator de comissões)
+        nome_dados = f"tramitacao-{tipo_projeto}-{ano}"
         
-        for dado in dados:
-            lista_insercao = []
-            lista_insercao.append([
-                dado["info_projeto"],
-                dado.get("ementa", "Ementa não disponível"),
-                dado["data_apresent"],
-                dado["data_aprovacao"],
-                dado["tempo_tramitacao"]
-            ])
-            escrever_arquivo_csv(caminho_arquivo_csv, lista_insercao, CABECALHO)
-        
-        escrever_planilha(caminho_arquivo_csv, caminho_arquivo_planilha)
+        with area_trabalho(f"tramitacao-{tipo_projeto}-{ano}") as trabalho:
+            diretorio_dados = os.path.join(trabalho, nome_dados)
+            criar_diretorio(diretorio_dados)
+            
+            caminho_arquivo_csv = f"{diretorio_dados}/projetos_tramitacao_{tipo_projeto}_{ano}.csv"
+            caminho_arquivo_planilha = f"{diretorio_dados}/projetos_tramitacao_{tipo_projeto}_{ano}.xlsx"
+            
+            coletor = ColetorCSV(CABECALHO)
+            for dado in dados:
+                coletor.adicionar(caminho_arquivo_csv, [[
+                    dado["info_projeto"],
+                    dado.get("ementa", "Ementa não disponível"),
+                    dado["data_apresent"],
+                    dado["data_aprovacao"],
+                    dado["tempo_tramitacao"]
+                ]])
+            coletor.gravar()
+            
+            escrever_planilha(caminho_arquivo_csv, caminho_arquivo_planilha)
+            
+            publicar(diretorio_dados, f"{DIRETORIO_RESULTADOS}/{nome_dados}")
+            caminho_arquivo_planilha = f"{DIRETORIO_RESULTADOS}/{nome_dados}/{os.path.basename(caminho_arquivo_planilha)}"
         
         fim = perf_counter()
         tempo_execucao = fim - inicio
@@ -214,3 +220,31 @@ def extrair_projetos_tramitacao(ano, tipo_projeto):
             'sucesso': False,
             'erro': str(e)
         }
+
+class ExtratorTramitacao(Extrator):
+    nome = "Projetos em Tramitação"
+    titulo = " Extração de Projetos em Tramitação"
+    descricao = "Este extrator coleta informações sobre projetos em tramitação na Câmara Municipal."
+    ordem = 30
+    
+    def formulario(self, st, ano):
+        tipo_projeto = st.sidebar.text_input(
+            "Tipo de Projeto:",
+            value="PL",
+            help="Ex: PL, PDL, PEC, etc."
+        )
+        return {'tipo_projeto': tipo_projeto}
+    
+    def mensagem_progresso(self, ano, parametros):
+        return f"Extraindo dados de {parametros['tipo_projeto']} do ano {ano}..."
+    
+    def executar(self, ano, reprocessar=False, perfil=False, **parametros):
+        return extrair_projetos_tramitacao(ano, parametros['tipo_projeto'], reprocessar, perfil)
+    
+    def metricas(self, resultado):
+        return [
+            ("Total de Projetos", resultado['total_projetos']),
+            ("Tempo de Execução", f"{resultado['tempo_execucao']:.2f}s")
+        ]
+
+EXTRATOR = ExtratorTramitacao()
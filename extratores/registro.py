@@ -0,0 +1,85 @@
+import ast
+import functools
+import importlib
+import os
+import pkgutil
+
+import extratores
+
+ATRIBUTOS_DESCRITOR = ("nome", "titulo", "descricao", "ordem")
+
+
+class DescritorExtrator:
+    """
+    Descrição leve de um extrator, obtida sem importar o seu módulo
+
+    carregar() importa o módulo (e, a partir dele, suas dependências) apenas
+    quando o extrator é de fato selecionado.
+    """
+
+    def __init__(self, modulo, nome, titulo="", descricao="", ordem=100):
+        self.modulo = modulo
+        self.nome = nome
+        self.titulo = titulo
+        self.descricao = descricao
+        self.ordem = ordem
+
+    def carregar(self):
+        """Importa o módulo e retorna o seu EXTRATOR"""
+        return importlib.import_module(f"extratores.{self.modulo}").EXTRATOR
+
+
+def _ler_descritor(nome_modulo, caminho):
+    """
+    Lê do código-fonte a classe atribuída a EXTRATOR e seus atributos literais
+
+    Returns:
+        DescritorExtrator ou None se o módulo não define EXTRATOR = <Classe>()
+    """
+    with open(caminho, encoding="utf-8") as f:
+        arvore = ast.parse(f.read(), filename=caminho)
+
+    classes = {no.name: no for no in arvore.body if isinstance(no, ast.ClassDef)}
+    nome_classe = None
+    for no in arvore.body:
+        if (isinstance(no, ast.Assign)
+                and any(isinstance(alvo, ast.Name) and alvo.id == "EXTRATOR" for alvo in no.targets)
+                and isinstance(no.value, ast.Call) and isinstance(no.value.func, ast.Name)):
+            nome_classe = no.value.func.id
+    if nome_classe not in classes:
+        return None
+
+    atributos = {}
+    for no in classes[nome_classe].body:
+        if isinstance(no, ast.Assign) and len(no.targets) == 1 and isinstance(no.targets[0], ast.Name):
+            if no.targets[0].id in ATRIBUTOS_DESCRITOR:
+                atributos[no.targets[0].id] = ast.literal_eval(no.value)
+    if "nome" not in atributos:
+        return None
+    return DescritorExtrator(nome_modulo, **atributos)
+
+
+@functools.lru_cache(maxsize=None)
+def descobrir_extratores():
+    """
+    Descobre os extratores disponíveis no pacote extratores
+
+    Lê o código-fonte de cada módulo do pacote (sem importá-lo) e registra os
+    que definem EXTRATOR. Novos extratores aparecem no app sem alterar app.py.
+
+    Returns:
+        dict: DescritorExtrator indexados pelo nome exibido, na ordem de exibição
+    """
+    encontrados = []
+    for modulo in pkgutil.iter_modules(extratores.__path__):
+        if modulo.name.startswith("_") or modulo.ispkg:
+            continue
+        caminho = os.path.join(modulo.module_finder.path, f"{modulo.name}.py")
+        if not os.path.exists(caminho):
+            continue
+        descritor = _ler_descritor(modulo.name, caminho)
+        if descritor is not None:
+            encontrados.append(descritor)
+
+    encontrados.sort(key=lambda descritor: (descritor.ordem, descritor.nome))
+    return {descritor.nome: descritor for descritor in encontrados}